@@ -1,35 +1,92 @@
+import platform
 import sys
+import time
+
+STARTUP = time.perf_counter()
 
 from PySide6.QtGui import QFontDatabase, QFont
 from PySide6.QtWidgets import QApplication
 
 from lib.components.main_window import MainWindow
+from lib.stores.icon_store import icon_store
+from lib.stores.task_store import task_store
 from lib.stores.theme_store import theme_store
+from lib.utils.perf import profiler
+from lib.utils.startup import StartupProfile
+
+PRIMARY_FONT = "assets/fonts/Roboto-Regular.ttf"
+SECONDARY_FONTS = (
+    "assets/fonts/Roboto-Bold.ttf",
+    "assets/fonts/Raleway-SemiBold-Light.ttf",
+    "assets/fonts/Raleway-SemiBold-Regular.ttf",
+)
+
+
+def load_secondary_fonts():
+    for path in SECONDARY_FONTS:
+        QFontDatabase.addApplicationFont(path)
+
+
+def install_perf_overlay(window, visible=False):
+    from lib.components.perf_overlay import PerfOverlay
+    window.perf_overlay = PerfOverlay(window)
+    if visible:
+        window.perf_overlay.toggle()
 
 
-def main():
-    app = QApplication(sys.argv)
+def main(asyncio_mode=False, startup_profile=False, perf=False, perf_trace=None):
+    profile = StartupProfile(STARTUP)
+    profile.mark("imports")
+    theme_store.detect_in_background()  # runs while QApplication and the font load
+
+    with profile.phase("qapplication"):
+        app = QApplication(sys.argv)
     # Optionally, set environment variables for scaling
     theme_store.app = app
 
     app.setApplicationName('App')
     app.setApplicationVersion('1.0.0')
+    app.aboutToQuit.connect(task_store.shutdown)
+
+    # Optional instrumentation of the UI hot paths (overlay: Ctrl+Shift+P)
+    if perf or perf_trace:
+        profiler.enable()
+    if perf_trace:
+        app.aboutToQuit.connect(lambda: profiler.export_chrome_trace(perf_trace))
+
+    # Optional asyncio mode: views can await coroutines via qt_asyncio.async_slot
+    if asyncio_mode:
+        from lib.utils import qt_asyncio  # asyncio import costs ~40 ms, only pay it when used
+        loop_driver = qt_asyncio.install()
+        app.aboutToQuit.connect(loop_driver.close)
 
-    # Fonts laden
-    font_id = QFontDatabase.addApplicationFont("assets/fonts/Roboto-Regular.ttf")  # default
-    QFontDatabase.addApplicationFont("assets/fonts/Roboto-Bold.ttf")
-    QFontDatabase.addApplicationFont("assets/fonts/Raleway-SemiBold-Light.ttf")
-    QFontDatabase.addApplicationFont("assets/fonts/Raleway-SemiBold-Regular.ttf")
-    if font_id != -1:  # Check if the font was loaded successfully
-        family = QFontDatabase.applicationFontFamilies(font_id)[0]  # Get the font family name
-        custom_font = QFont(family)
-        app.setFont(custom_font)  # Apply font globally
-    else:
-        print("Failed to load the font!")
+    # Fonts laden: nur die Standardschrift vor dem ersten Frame, der Rest danach
+    with profile.phase("primary_font"):
+        font_id = QFontDatabase.addApplicationFont(PRIMARY_FONT)  # default
+        if font_id != -1:  # Check if the font was loaded successfully
+            family = QFontDatabase.applicationFontFamilies(font_id)[0]  # Get the font family name
+            custom_font = QFont(family)
+            app.setFont(custom_font)  # Apply font globally
+        else:
+            print("Failed to load the font!")
+
+    with profile.phase("theme_detection"):
+        theme_store.wait_for_detection()
 
     # Create and show the main window
-    main_window = MainWindow()
-    main_window.show()
+    with profile.phase("main_window"):
+        main_window = MainWindow()
+    with profile.phase("show"):
+        main_window.show()
+
+    # Everything not needed for the first frame
+    profile.after_first_paint(main_window, [
+        ("secondary_fonts", load_secondary_fonts),
+        ("view_modules", main_window.view_manager.import_factories),
+        ("icon_atlas", icon_store.ensure_atlas),
+        ("icons", lambda: icon_store.preload(not theme_store.dark_mode)),
+        ("perf_overlay", lambda: install_perf_overlay(main_window, visible=perf)),
+    ], on_done=(lambda done: print(done.report())) if startup_profile else None)
 
     sys.exit(app.exec())
 
@@ -37,10 +94,17 @@ def main():
 if __name__ == "__main__":
     # Set DPI Awareness
 
-    # Initialize ThemeManager and detect system theme
-    if theme_store.dark_mode:
-        sys.argv += ['-platform', 'windows:darkmode=2']
-    else:
-        sys.argv += ['-platform', 'windows:darkmode=0']
+    # Initialize ThemeManager and detect system theme (only Windows needs it before the QApplication)
+    if platform.system() == "Windows":
+        if theme_store.dark_mode:
+            sys.argv += ['-platform', 'windows:darkmode=2']
+        else:
+            sys.argv += ['-platform', 'windows:darkmode=0']
 
-    main()
+    perf_trace = sys.argv[sys.argv.index("--perf-trace") + 1] if "--perf-trace" in sys.argv[:-1] else None
+    main(
+        asyncio_mode="--asyncio" in sys.argv,
+        startup_profile="--startup-profile" in sys.argv,
+        perf="--perf" in sys.argv,
+        perf_trace=perf_trace,
+    )
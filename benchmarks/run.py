@@ -0,0 +1,308 @@
+"""Headless startup, interaction and memory benchmarks for the sidebar app.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.run
+    python -m benchmarks.run --sizes 10 100 --backends sidebar --output results.json
+    python -m benchmarks.run --update-baseline
+
+Every (backend, menu size) case runs in its own process so memory numbers
+do not leak into each other. Results are compared with
+benchmarks/baseline.json; a metric that is worse than the baseline by more
+than the tolerance fails the run with exit code 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+SIZES = (10, 100, 1000)
+BACKENDS = ("sidebar", "virtual")
+ICON_NAMES = ("home", "settings", "template", "workschedule_generator", "menu", "moon", "sun")
+VIEW_FACTORIES = (
+    "lib.views.example1_view:Example1View",
+    "lib.views.example2_view:Example2View",
+    "lib.views.example3_view:Example3View",
+)
+
+# Regressions smaller than these are treated as noise
+TOLERANCE = 0.5
+REPEAT = 3  # processes per case, the median of each metric is reported
+ABSOLUTE_FLOOR = {"ms": 2.0, "mb": 8.0, "per_s": 0.0}
+
+
+def synthetic_menu(size):
+    """Menu spec with `size` entries: groups of one submenu title and nine views."""
+    spec = []
+    count = 0
+    while count < size:
+        group = {"title": f"Group {len(spec)}", "view_key": None, "icon": ICON_NAMES[len(spec) % len(ICON_NAMES)], "submenu": []}
+        count += 1
+        while count < size and len(group["submenu"]) < 9:
+            index = count
+            group["submenu"].append({"title": f"Entry {index}", "view_key": f"view_{index}", "icon": ICON_NAMES[index % len(ICON_NAMES)]})
+            count += 1
+        spec.append(group)
+    return spec
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        import resource  # peak instead of current RSS where /proc is missing
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if platform.system() == "Darwin" else peak / 2 ** 10
+
+
+def run_case(backend, size, switches=200, hovers=200):
+    """Measure one backend and menu size in this process; returns a flat metrics dict."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    from PySide6.QtCore import QEvent, QEventLoop, QObject, QPointF, QSize, QTimer
+    from PySide6.QtGui import QHoverEvent
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+
+    from lib.components.main_window import MainWindow
+    from lib.components.menu_model import MenuModel
+    from lib.components.sidebar import Sidebar
+    from lib.components.virtual_sidebar import NodeRole, VirtualSidebar
+    from lib.stores.icon_store import icon_store
+    from lib.stores.theme_store import theme_store
+
+    theme_store.app = app
+    theme_store.dark_mode = False
+
+    def wait(ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    def toggle_and_wait(sidebar, timeout_s=30):
+        count = len(sidebar.animation_stats)
+        sidebar.toggle_sidebar()
+        deadline = time.perf_counter() + timeout_s
+        while len(sidebar.animation_stats) == count and time.perf_counter() < deadline:
+            wait(20)
+        return sidebar.animation_stats[-1]
+
+    class FirstPaint(QObject):
+        painted_at = None
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and self.painted_at is None:
+                self.painted_at = time.perf_counter()
+            return False
+
+    metrics = {"rss_start_mb": rss_mb()}
+    model = MenuModel.from_spec(synthetic_menu(size))
+    view_keys = list(model.view_keys())
+
+    start = time.perf_counter()
+    window = MainWindow(menu_model=model, sidebar_class=VirtualSidebar if backend == "virtual" else Sidebar)
+    for index, view_key in enumerate(view_keys):
+        window.register_view(view_key, VIEW_FACTORIES[index % len(VIEW_FACTORIES)])
+    metrics["construct_ms"] = (time.perf_counter() - start) * 1000
+
+    watcher = FirstPaint()
+    window.installEventFilter(watcher)
+    shown = time.perf_counter()
+    window.show()
+    while watcher.painted_at is None and time.perf_counter() - shown < 5:
+        app.processEvents()
+    metrics["first_paint_ms"] = ((watcher.painted_at or time.perf_counter()) - start) * 1000
+    wait(50)
+
+    toggles = [theme_store.toggle_theme()["total_ms"] for _ in range(10)]
+    metrics["toggle_theme_ms"] = statistics.median(toggles)
+
+    sidebar = window.sidebar
+    frames = []
+    for _ in range(2):
+        frames.append(toggle_and_wait(sidebar))
+    metrics["animation_avg_frame_ms"] = statistics.mean(stats["avg_frame_ms"] for stats in frames)
+    metrics["animation_max_frame_ms"] = max(stats["max_frame_ms"] for stats in frames)
+    metrics["animation_dropped_frames"] = sum(stats["dropped_frames"] for stats in frames)
+
+    highlight = []
+    for view_key in view_keys[:200]:
+        begin = time.perf_counter()
+        sidebar.highlight_nav_button(view_key)
+        highlight.append((time.perf_counter() - begin) * 1000)
+    metrics["highlight_ms"] = statistics.median(highlight) if highlight else 0.0
+
+    # Seam shadow: repaint and resize cost of the QGraphicsDropShadowEffect vs. the cached strip.
+    # Both modes are warmed up first and measured in alternating order, so neither profits from running second.
+    window_size = window.size()
+    shadow_modes = ("effect", "strip")
+    repaints = {mode: [] for mode in shadow_modes}
+    resizes = {mode: [] for mode in shadow_modes}
+    for round_ in range(-1, 10):
+        for mode in (shadow_modes if round_ % 2 == 0 else shadow_modes[::-1]):
+            theme_store.set_shadow_mode(mode)
+            wait(20)
+            begin = time.perf_counter()
+            window.content_area.repaint()
+            repaint_ms = (time.perf_counter() - begin) * 1000
+            begin = time.perf_counter()
+            window.resize(window_size.width() - 10, window_size.height())
+            app.processEvents()
+            window.repaint()
+            resize_ms = (time.perf_counter() - begin) * 1000
+            window.resize(window_size)
+            app.processEvents()
+            if round_ >= 0:  # round -1 only warms up
+                repaints[mode].append(repaint_ms)
+                resizes[mode].append(resize_ms)
+    for mode in shadow_modes:
+        metrics[f"repaint_{mode}_ms"] = statistics.median(repaints[mode])
+        metrics[f"resize_{mode}_ms"] = statistics.median(resizes[mode])
+    theme_store.set_shadow_mode("strip")
+
+    icon_store.icon_cache.clear()
+    icon_store.mask_cache.clear()
+    variants = [(name, size_px) for name in ICON_NAMES for size_px in (16, 18, 24, 32, 48)]
+    dpr = window.devicePixelRatioF()
+    # Icons render lazily, so each load includes the pixmap at the window's pixel ratio
+    begin = time.perf_counter()
+    for name, size_px in variants:
+        icon_store.load_iconify_icon(name, False, size=size_px).pixmap(QSize(size_px, size_px), dpr)
+    metrics["icon_uncached_per_s"] = len(variants) / (time.perf_counter() - begin)
+    begin = time.perf_counter()
+    for _ in range(20):
+        for name, size_px in variants:
+            icon_store.load_iconify_icon(name, False, size=size_px).pixmap(QSize(size_px, size_px), dpr)
+    metrics["icon_cached_per_s"] = 20 * len(variants) / (time.perf_counter() - begin)
+
+    before = rss_mb()
+    for index in range(switches):
+        window.set_view(view_keys[index % len(view_keys)] if view_keys else "home")
+        if index % 20 == 0:
+            app.processEvents()
+    wait(50)
+    metrics["rss_after_switches_mb"] = rss_mb()
+    metrics["switch_growth_mb"] = metrics["rss_after_switches_mb"] - before
+
+    # Hover menus in the collapsed sidebar
+    toggle_and_wait(sidebar)
+    before = rss_mb()
+    begin = time.perf_counter()
+    if backend == "virtual":
+        rows = [row for row in range(sidebar.list_model.rowCount()) if sidebar.list_model.index(row).data(NodeRole).children]
+        for index in range(hovers if rows else 0):
+            sidebar._show_context_for(sidebar.list_model.index(rows[index % len(rows)]))
+            sidebar.close_context_menu()
+    else:
+        titles = [button for node, button in sidebar.nav_buttons.items() if node.children]
+        for index in range(hovers if titles else 0):
+            button = titles[index % len(titles)]
+            QApplication.sendEvent(button, QHoverEvent(QEvent.HoverEnter, QPointF(5, 5), QPointF(5, 5), QPointF(-1, -1)))
+            sidebar.hover_tracker.close()
+    metrics["hover_menu_ms"] = (time.perf_counter() - begin) * 1000 / max(1, hovers)
+    wait(50)
+    metrics["hover_growth_mb"] = rss_mb() - before
+    metrics["rss_end_mb"] = rss_mb()
+    return metrics
+
+
+def run_all(backends, sizes, repeat=REPEAT):
+    """Run every case `repeat` times in fresh processes and keep the median of each metric."""
+    results = {}
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    for backend in backends:
+        for size in sizes:
+            case = f"{backend}/{size}"
+            print(f"running {case} ...", file=sys.stderr, flush=True)
+            runs = []
+            for _ in range(repeat):
+                completed = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.run", "--case", case],
+                    cwd=ROOT, env=env, capture_output=True, text=True,
+                )
+                if completed.returncode != 0:
+                    raise SystemExit(f"benchmark case {case} crashed:\n{completed.stderr}")
+                runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+            results[case] = {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+    return results
+
+
+def unit(metric):
+    if metric.endswith("_per_s"):
+        return "per_s"
+    return "mb" if metric.endswith("_mb") else "ms"
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """List of regressions (case, metric, baseline, current) beyond the tolerance."""
+    regressions = []
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(case, {}).get(metric)
+            if reference is None or metric.startswith("rss_") or metric == "animation_dropped_frames":
+                continue  # absolute RSS and dropped frames depend on the machine; growth is compared
+            if unit(metric) == "per_s":
+                worse = value < reference * (1 - tolerance)
+            else:
+                worse = value > reference * (1 + tolerance) and value - reference > ABSOLUTE_FLOOR[unit(metric)]
+            if worse:
+                regressions.append((case, metric, reference, value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # internal: run one case and print JSON
+    args = parser.parse_args(argv)
+
+    if args.case:
+        backend, size = args.case.split("/")
+        print(json.dumps(run_case(backend, int(size))))
+        return 0
+
+    results = run_all(args.backends, args.sizes, args.repeat)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            file.write(json.dumps(results, indent=2, sort_keys=True))
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline found, run with --update-baseline to create one", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        regressions = compare(results, json.load(file), args.tolerance)
+    for case, metric, reference, value in regressions:
+        print(f"REGRESSION {case} {metric}: {value:.2f} (baseline {reference:.2f})", file=sys.stderr)
+    if regressions:
+        print(f"{len(regressions)} benchmark regression(s) beyond {args.tolerance:.0%}", file=sys.stderr)
+        return 1
+    print("no regressions against the baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+from PySide6.QtCore import QEvent, QSize, Qt, Signal
+from PySide6.QtWidgets import QLabel, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+
+from lib.stores.icon_store import icon_store
+from lib.stores.task_store import TaskQueueFull
+from lib.stores.theme_store import theme_store
+from lib.utils.fuzzy_index import FuzzyIndex
+
+PALETTE_WIDTH = 480
+VISIBLE_ROWS = 10
+ROW_HEIGHT = 32
+
+
+class CommandPalette(QWidget):
+    """Keyboard driven jump to any view of the menu, opened with Ctrl+K by the MainWindow.
+
+    Matching runs against a FuzzyIndex that follows the menu model; while the
+    index is rebuilt for a large menu the search runs on a worker thread.
+    """
+    view_selected = Signal(str)
+
+    def __init__(self, window, menu_model):
+        super().__init__(window, Qt.Popup | Qt.FramelessWindowHint)
+        self.setObjectName("CommandPalette")
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.window = window
+        self.index = FuzzyIndex(limit=VISIBLE_ROWS * 2)
+        self.index.attach(menu_model)
+        self.query = ""
+        self.search_task = None
+
+        self.input = QLineEdit(self)
+        self.input.setObjectName("CommandPaletteInput")
+        self.input.setPlaceholderText("Go to view …")
+        self.input.textChanged.connect(self.search)
+        self.input.installEventFilter(self)
+
+        self.results = QListWidget(self)
+        self.results.setObjectName("CommandPaletteResults")
+        self.results.setIconSize(QSize(18, 18))
+        self.results.setUniformItemSizes(True)
+        self.results.itemActivated.connect(self._on_item_activated)
+
+        self.status = QLabel(self)
+        self.status.setObjectName("CommandPaletteStatus")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+        layout.addWidget(self.input)
+        layout.addWidget(self.results)
+        layout.addWidget(self.status)
+
+    def open(self):
+        """Show the palette centered at the top of the window with an empty query."""
+        self.input.clear()
+        self.search("")
+        width = min(PALETTE_WIDTH, self.window.width() - 40)
+        self.setFixedWidth(width)
+        self.results.setFixedHeight(ROW_HEIGHT * VISIBLE_ROWS + 4)
+        top_left = self.window.mapToGlobal(self.window.rect().topLeft())
+        self.move(top_left.x() + (self.window.width() - width) // 2, top_left.y() + 60)
+        self.show()
+        self.input.setFocus()
+
+    def search(self, text):
+        self.query = text
+        if self.search_task is not None:
+            self.search_task.cancel()
+            self.search_task = None
+        if not text.strip():
+            self.show_matches([])
+            return
+        if self.index.rebuilding:
+            self.status.setText("Indexing …")
+        try:
+            self.search_task = self.index.search_async(text, lambda matches, text=text: self._on_matches(text, matches), owner=self)
+        except TaskQueueFull:
+            self._on_matches(text, self.index.search(text))  # worker pool busy: search the current index
+
+    def _on_matches(self, text, matches):
+        if text != self.query:
+            return  # an older query finished late
+        self.search_task = None
+        self.show_matches(matches)
+
+    def show_matches(self, matches):
+        self.results.setUpdatesEnabled(False)
+        self.results.clear()
+        dark_mode = theme_store.dark_mode
+        for match in matches:
+            label = f"{match.title}   ·   {match.path}" if match.path else match.title
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, match.view_key)
+            item.setSizeHint(QSize(0, ROW_HEIGHT))
+            if match.icon:
+                item.setIcon(icon_store.load_iconify_icon(match.icon, dark_mode, size=18))
+            self.results.addItem(item)
+        if matches:
+            self.results.setCurrentRow(0)
+        self.results.setUpdatesEnabled(True)
+        self.status.setText(f"{len(matches)} results" if self.query.strip() else f"{len(self.index)} views")
+
+    def activate_current(self):
+        item = self.results.currentItem()
+        if item is not None:
+            self._on_item_activated(item)
+
+    def _on_item_activated(self, item):
+        self.hide()
+        self.view_selected.emit(item.data(Qt.UserRole))
+
+    def eventFilter(self, obj, event):
+        # Arrow keys and Enter in the input field steer the result list
+        if obj is self.input and event.type() == QEvent.KeyPress:
+            key = event.key()
+            if key in (Qt.Key_Down, Qt.Key_Up):
+                step = 1 if key == Qt.Key_Down else -1
+                count = self.results.count()
+                if count:
+                    self.results.setCurrentRow((self.results.currentRow() + step) % count)
+                return True
+            if key in (Qt.Key_Return, Qt.Key_Enter):
+                self.activate_current()
+                return True
+        return super().eventFilter(obj, event)
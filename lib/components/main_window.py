@@ -1,15 +1,13 @@
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout
+from lib.components.seam_shadow import SeamShadow
 from lib.components.sidebar import Sidebar
+from lib.components.view_manager import ViewManager
 from lib.stores.theme_store import theme_store
 
-from lib.views.home_view import HomeView
-from lib.views.example1_view import Example1View
-from lib.views.example2_view import Example2View
-from lib.views.example3_view import Example3View
-
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, max_live_views=8, menu_model=None, sidebar_class=Sidebar):
         super().__init__()
         self.setWindowTitle("Modern Sidebar")
         self.setGeometry(2800, 100, 1200, 720)
@@ -18,7 +16,7 @@ class MainWindow(QMainWindow):
         self.current_view = None
 
         # Sidebar and Content Area
-        self.sidebar = Sidebar(self)
+        self.sidebar = sidebar_class(self, menu_model)
 
         # Create a content area
         self.content_area = QWidget()
@@ -27,18 +25,12 @@ class MainWindow(QMainWindow):
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(0)
 
-        # Store views in a dictionary for reuse
-        self.views = {
-            "home": HomeView(self.content_area),
-            "example1": Example1View(self.content_area),
-            "example2": Example2View(self.content_area),
-            "example3": Example3View(self.content_area),
-        }
-
-        # Add all views to the layout but make them initially invisible
-        for view in self.views.values():
-            self.content_layout.addWidget(view)
-            view.setVisible(False)
+        # View factories; modules are imported and views created on first use, evicted when over the limit
+        self.view_manager = ViewManager(self.content_area, self.content_layout, max_live_views)
+        self.register_view("home", "lib.views.home_view:HomeView")
+        self.register_view("example1", "lib.views.example1_view:Example1View")
+        self.register_view("example2", "lib.views.example2_view:Example2View")
+        self.register_view("example3", "lib.views.example3_view:Example3View")
 
         # Layout for MainWindow
         central_widget = QWidget()
@@ -50,6 +42,14 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(central_widget)
 
+        # Shadow strip at the sidebar/content seam, used in theme_store.shadow_mode "strip"
+        self.seam_shadow = SeamShadow(central_widget, self.content_area)
+
+        # Command palette, built on first use
+        self.command_palette = None
+        self.palette_shortcut = QShortcut(QKeySequence("Ctrl+K"), self)
+        self.palette_shortcut.activated.connect(self.open_command_palette)
+
         # Initialize ThemeManager
         if theme_store.dark_mode:
             theme_store.apply_dark_theme(self)
@@ -59,9 +59,34 @@ class MainWindow(QMainWindow):
         # Set default view
         self.set_view("home")
 
+    @property
+    def views(self):
+        """Currently live views by view key."""
+        return self.view_manager.views
+
+    def register_view(self, view_key, factory):
+        """Register a view factory (or "module:Class" string), called with the content area as parent on first use."""
+        self.view_manager.register(view_key, factory)
+
+    def get_view(self, view_key):
+        """Return the view for a key, creating it on first access."""
+        return self.view_manager.get(view_key)
+
+    def open_command_palette(self):
+        """Open the fuzzy search over all views of the sidebar menu."""
+        if self.command_palette is None:
+            from lib.components.command_palette import CommandPalette
+            self.command_palette = CommandPalette(self, self.sidebar.menu_model)
+            self.command_palette.view_selected.connect(self.set_view)
+        self.command_palette.open()
+
+    def prewarm_views(self, view_keys=None):
+        """Create not yet built views whenever the event loop is idle."""
+        self.view_manager.prewarm(view_keys)
+
     def set_view(self, view_key):
         """Set the main view in the content area by view key."""
-        if view_key not in self.views:
+        if view_key not in self.view_manager:
             print(f"Invalid view key: {view_key}")
             return  # Invalid view key, do nothing
 
@@ -69,11 +94,7 @@ class MainWindow(QMainWindow):
         if self.current_view == view_key:
             return
 
-        # Hide the current view
-        if self.current_view:
-            self.views[self.current_view].setVisible(False)
-
-        # Show the selected view
-        self.views[view_key].setVisible(True)
+        # Hide the current view and show the selected one
+        self.view_manager.show(view_key)
         self.current_view = view_key
         self.sidebar.highlight_nav_button(view_key)
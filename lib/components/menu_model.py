@@ -0,0 +1,132 @@
+import json
+
+
+class MenuNode:
+    """A menu entry; entries with children are submenus."""
+    __slots__ = ("title", "view_key", "icon", "children", "parent", "ancestors", "__weakref__")
+
+    def __init__(self, title, view_key=None, icon=None, parent=None):
+        self.title = title
+        self.view_key = view_key
+        self.icon = icon
+        self.children = []
+        self.parent = parent
+        # Chain from the root entry down to the parent, precomputed on insert
+        self.ancestors = parent.ancestors + (parent,) if parent is not None else ()
+
+    def __repr__(self):
+        return f"MenuNode({self.title!r}, view_key={self.view_key!r})"
+
+    @property
+    def depth(self):
+        return len(self.ancestors)
+
+    @property
+    def root(self):
+        return self.ancestors[0] if self.ancestors else self
+
+    def walk(self):
+        """This node and all descendants, depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def leaves(self):
+        """All descendants that open a view."""
+        return [node for node in self.walk() if node is not self and node.view_key is not None]
+
+
+class MenuModel:
+    """Navigation tree with O(1) lookups from view_key to entry and ancestor chain.
+
+    Build it from a spec (list of dicts with "title", "view_key", "icon" and
+    "submenu"/"children"), from a JSON or YAML file, or with `add()`.
+    Listeners are called as `listener(event, node)` with "add" or "remove".
+    """
+
+    def __init__(self):
+        self.roots = []
+        self._by_view_key = {}
+        self._count = 0
+        self.listeners = []
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for root in self.roots:
+            yield from root.walk()
+
+    def __contains__(self, view_key):
+        return view_key in self._by_view_key
+
+    @classmethod
+    def from_spec(cls, spec):
+        model = cls()
+        model.extend(spec)
+        return model
+
+    @classmethod
+    def from_json(cls, path):
+        with open(path, encoding="utf-8") as file:
+            return cls.from_spec(json.load(file))
+
+    @classmethod
+    def from_yaml(cls, path):
+        import yaml  # optional dependency, only needed for YAML specs
+        with open(path, encoding="utf-8") as file:
+            return cls.from_spec(yaml.safe_load(file))
+
+    def extend(self, spec, parent=None):
+        """Add all entries of a spec below `parent` (or as roots)."""
+        stack = [(item, parent) for item in reversed(spec)]
+        while stack:
+            item, item_parent = stack.pop()
+            node = self.add(item["title"], item.get("view_key"), item.get("icon"), item_parent)
+            children = item.get("submenu") or item.get("children") or []
+            stack.extend((child, node) for child in reversed(children))
+
+    def add(self, title, view_key=None, icon=None, parent=None):
+        """Append an entry below `parent` (or as root) and index it."""
+        if view_key is not None and view_key in self._by_view_key:
+            raise ValueError(f"Duplicate view key: {view_key}")
+        node = MenuNode(title, view_key, icon, parent)
+        (parent.children if parent is not None else self.roots).append(node)
+        if view_key is not None:
+            self._by_view_key[view_key] = node
+        self._count += 1
+        self._notify("add", node)
+        return node
+
+    def remove(self, node):
+        """Remove an entry and its descendants."""
+        (node.parent.children if node.parent is not None else self.roots).remove(node)
+        for removed in node.walk():
+            if removed.view_key is not None:
+                self._by_view_key.pop(removed.view_key, None)
+            self._count -= 1
+            self._notify("remove", removed)
+
+    def node(self, view_key):
+        return self._by_view_key.get(view_key)
+
+    def ancestors(self, view_key):
+        """Ancestor chain of a view key from the root entry down, empty if unknown."""
+        node = self._by_view_key.get(view_key)
+        return node.ancestors if node is not None else ()
+
+    def view_keys(self):
+        return self._by_view_key.keys()
+
+    def to_spec(self):
+        def convert(node):
+            item = {"title": node.title, "view_key": node.view_key, "icon": node.icon}
+            item["submenu"] = [convert(child) for child in node.children]
+            return item
+        return [convert(root) for root in self.roots]
+
+    def _notify(self, event, node):
+        for listener in self.listeners:
+            listener(event, node)
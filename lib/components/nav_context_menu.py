@@ -1,9 +1,9 @@
-from PySide6.QtCore import Qt, Signal, QRect, QPoint, QSize
-from PySide6.QtGui import QCursor
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton
+from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QApplication
 
 from lib.stores.icon_store import icon_store
 from lib.stores.theme_store import theme_store
+from lib.utils.ui_batch import repolish, ui_batch
 
 
 class NavContextMenu(QWidget):
@@ -17,9 +17,15 @@ class NavContextMenu(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setSpacing(0)
         self.layout.setContentsMargins(0, 0, 0, 0)
-        self.installEventFilter(self)
+        self.action_buttons = {}  # view_key -> Button
+        self.active_key = None
 
-    def add_action(self, text, icon, callback=None, active=False):
+    @staticmethod
+    def open_windows():
+        """Anzahl existierender NavContextMenu-Fenster (zum Prüfen auf Leaks)."""
+        return sum(1 for widget in QApplication.topLevelWidgets() if isinstance(widget, NavContextMenu))
+
+    def add_action(self, text, icon, callback=None, active=False, view_key=None):
         """Add an action to the custom menu."""
         submenu_button = QPushButton(" " + text)
 
@@ -30,6 +36,11 @@ class NavContextMenu(QWidget):
         submenu_button.setIconSize(QSize(32, 18))
         submenu_button.setContentsMargins(10, 10, 10, 10)
         submenu_button.setProperty('active', active)
+        submenu_button.setProperty('view_key', view_key)
+        if view_key is not None:
+            self.action_buttons[view_key] = submenu_button
+            if active:
+                self.active_key = view_key
 
         # Connect the mouse press event to trigger the callback
         submenu_button.mousePressEvent = lambda event: self._on_action_triggered(submenu_button, callback)
@@ -47,32 +58,37 @@ class NavContextMenu(QWidget):
             callback()
 
     def set_button_active(self, active_button):
+        view_key = active_button.property("view_key")
+        if view_key is not None:
+            self.set_active_key(view_key)
+            return
+
         active_button.setProperty("active", True)
-        for i in range(self.layout.count()):
-            button = self.layout.itemAt(i).widget()
-            if button != active_button:
-                button.setProperty("active", False)
-            button.style().unpolish(button)
-            button.style().polish(button)
-            button.update()
-            icon_store.update_icon_color_from_func(button, lambda: button.palette().color(button.foregroundRole()))
+        with ui_batch(self):
+            for i in range(self.layout.count()):
+                button = self.layout.itemAt(i).widget()
+                if button != active_button:
+                    button.setProperty("active", False)
+                repolish(button)
+                icon_store.update_icon_color_from_func(button, lambda button=button: button.palette().color(button.foregroundRole()))
+
+    def set_active_key(self, view_key):
+        """Markiert den Eintrag `view_key` als aktiv; nur geänderte Buttons werden neu gestylt."""
+        previous = self.active_key
+        self.active_key = view_key
+        with ui_batch(self):
+            for key in {previous, view_key}:
+                button = self.action_buttons.get(key)
+                if button is None:
+                    continue
+                icon_store.apply_pending(button)  # ausstehendes Theme-Icon vor dem Einfärben übernehmen
+                if previous != view_key:
+                    button.setProperty("active", key == view_key)
+                    repolish(button)
+                icon_store.update_icon_color_from_func(button, lambda button=button: button.palette().color(button.foregroundRole()))
 
     def show_menu(self, pos):
         """Display the menu at the given position."""
         self.move(pos)
         self.adjustSize()
         self.show()
-
-    def eventFilter(self, obj, event):
-        parent_button = self.property("parent_button")
-        if parent_button is None:
-            return super().eventFilter(obj, event)
-
-        global_pos = QCursor.pos()
-        button_geometry = QRect(parent_button.mapToGlobal(QPoint(0, 0)), parent_button.size())
-        if not self.geometry().contains(global_pos) and not button_geometry.contains(global_pos):
-            parent_button.setProperty("context_is_open", False)
-            parent_button.setProperty("submenu", None)
-            self.close()  # Close the menu when the mouse leaves
-
-        return super().eventFilter(obj, event)
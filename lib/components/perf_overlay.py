@@ -0,0 +1,65 @@
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtWidgets import QLabel
+
+from lib.utils import ui_batch
+from lib.utils.perf import profiler
+
+REFRESH_MS = 500
+
+
+class PerfOverlay(QLabel):
+    """Semi-transparent table of hot path timings in the top right corner of a window.
+
+    Toggle it with Ctrl+Shift+P; showing it enables the profiler, hiding it
+    disables the profiler again unless it was already enabled (--perf, --perf-trace).
+    """
+
+    def __init__(self, window, shortcut="Ctrl+Shift+P"):
+        super().__init__(window)
+        self.window = window
+        self.setObjectName("PerfOverlay")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.RichText)
+        self.setStyleSheet(
+            "QLabel#PerfOverlay { background: rgba(0, 0, 0, 180); color: #ffffff;"
+            " font-family: monospace; font-size: 11px; padding: 6px; border-radius: 4px; }"
+        )
+        self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_MS)
+        self.timer.timeout.connect(self.refresh)
+        self.owns_profiler = False  # enabled by the overlay, not by the command line
+        self.shortcut = QShortcut(QKeySequence(shortcut), window)
+        self.shortcut.activated.connect(self.toggle)
+        self.hide()
+
+    def toggle(self):
+        if self.isVisible():
+            self.timer.stop()
+            self.hide()
+            if self.owns_profiler:
+                profiler.disable()
+                self.owns_profiler = False
+        else:
+            self.owns_profiler = not profiler.enabled
+            profiler.enable()
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.timer.start()
+
+    def refresh(self):
+        batch = ui_batch.stats()
+        rows = "".join(
+            f"<tr><td>{name}</td><td align='right'>{entry['count']}</td>"
+            f"<td align='right'>{entry['avg_ms']:.2f}</td><td align='right'>{entry['max_ms']:.2f}</td>"
+            f"<td align='right'>{entry['last_ms']:.2f}</td></tr>"
+            for name, entry in sorted(profiler.summary().items())
+        )
+        self.setText(
+            "<table cellspacing='4'><tr><th align='left'>ms</th><th>n</th><th>avg</th><th>max</th><th>last</th></tr>"
+            f"{rows}</table>"
+            f"ui_batch: {batch['batches']} batches, {batch['coalesced']} updates coalesced"
+        )
+        self.adjustSize()
+        self.move(self.window.width() - self.width() - 10, 10)
@@ -0,0 +1,87 @@
+import math
+
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QColor, QLinearGradient, QPainter, QPixmap
+from PySide6.QtWidgets import QWidget
+
+from lib.utils.lru_cache import LRUCache
+
+SHADOW_CACHE_BUDGET = 1024 * 1024  # Bytes, a few window heights per theme
+SHADOW_OFFSET = 5  # same horizontal offset as the former drop shadow effect
+GRADIENT_STOPS = 8
+
+_cache = LRUCache(SHADOW_CACHE_BUDGET, lambda pixmap: pixmap.width() * pixmap.height() * 4 or 1)
+
+
+def shadow_width(blur_radius):
+    """Width of the strip: how far the blur reaches past the seam."""
+    return max(2, blur_radius)
+
+
+def shadow_pixmap(color, blur_radius, height, device_pixel_ratio=1.0):
+    """Pre-blurred shadow strip, cached per color, blur radius, height and ratio."""
+    key = (QColor(color).rgba(), blur_radius, height, device_pixel_ratio)
+    return _cache.get_or_create(key, lambda: _render(QColor(color), blur_radius, height, device_pixel_ratio))
+
+
+def _render(color, blur_radius, height, device_pixel_ratio):
+    width = shadow_width(blur_radius)
+    pixmap = QPixmap(round(width * device_pixel_ratio), max(1, round(height * device_pixel_ratio)))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+
+    # Gaussian falloff from the seam (right edge) outwards, like the blurred effect
+    gradient = QLinearGradient(QPointF(width, 0), QPointF(0, 0))
+    variance = 2 * (blur_radius / 2) ** 2
+    peak = color.alphaF() * 0.2
+    for step in range(GRADIENT_STOPS + 1):
+        position = step / GRADIENT_STOPS
+        distance = position * width + SHADOW_OFFSET
+        stop = QColor(color)
+        stop.setAlphaF(peak * math.exp((SHADOW_OFFSET ** 2 - distance ** 2) / variance))
+        gradient.setColorAt(position, stop)
+
+    painter = QPainter(pixmap)
+    painter.fillRect(0, 0, width, height, gradient)
+    painter.end()
+    return pixmap
+
+
+class SeamShadow(QWidget):
+    """Narrow shadow strip left of `content_area`, a cheap stand-in for QGraphicsDropShadowEffect.
+
+    It only paints a cached pixmap and follows the content area's geometry,
+    so the content itself is never rendered offscreen or blurred.
+    """
+
+    def __init__(self, parent, content_area):
+        super().__init__(parent)
+        self.content_area = content_area
+        self.color = QColor(0, 0, 0, 150)
+        self.blur_radius = 13
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        content_area.installEventFilter(self)
+        self.hide()
+
+    def set_shadow(self, color, blur_radius):
+        self.color = QColor(color)
+        self.blur_radius = blur_radius
+        self.follow()
+        self.update()
+
+    def follow(self):
+        geometry = self.content_area.geometry()
+        width = shadow_width(self.blur_radius)
+        self.setGeometry(geometry.x() - width, geometry.y(), width, geometry.height())
+        self.raise_()
+
+    def eventFilter(self, obj, event):
+        if obj is self.content_area and event.type() in (QEvent.Move, QEvent.Resize):
+            self.follow()
+        return False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, shadow_pixmap(self.color, self.blur_radius, self.height(), self.devicePixelRatioF()))
+        painter.end()
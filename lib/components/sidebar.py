@@ -1,10 +1,23 @@
-from PySide6.QtCore import QPropertyAnimation, QSize, Qt, QRect, QEvent, QPoint, Property
-from PySide6.QtGui import QCursor
+from PySide6.QtCore import QPropertyAnimation, QSize, Qt, QEvent, Property, QTimer
 from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QPushButton, QWidget, QFrame, QLabel
 
+from lib.components.menu_model import MenuModel
 from lib.components.nav_context_menu import NavContextMenu
 from lib.stores.icon_store import icon_store, IconUpdateCallback
 from lib.stores.theme_store import theme_store
+from lib.utils.frame_timer import FrameTimer
+from lib.utils.hover_tracker import HoverTracker
+from lib.utils.ui_batch import repolish, ui_batch
+
+# Standard-Menüeinträge, falls kein MenuModel übergeben wird
+DEFAULT_MENU = [
+    {"title": "Home", "view_key": "home", "icon": "workschedule_generator", "submenu": []},
+    {"title": "Settings", "view_key": None, "icon": "settings", "submenu": [
+        {"title": "Example 2", "view_key": "example1", "icon": "template"},
+        {"title": "Example 3", "view_key": "example2", "icon": "workschedule_generator"},
+    ]},
+    {"title": "Example 4", "view_key": "example3", "icon": "template", "submenu": []},
+]
 
 
 class Sidebar(QWidget):
@@ -12,7 +25,7 @@ class Sidebar(QWidget):
     def sidebar_width(self):
         return self._sidebar_width
 
-    def __init__(self, main_window):
+    def __init__(self, main_window, menu_model=None):
         super().__init__()
         self.main_window = main_window
         self.expanded = True  # Sidebar startet ausgeklappt
@@ -20,6 +33,11 @@ class Sidebar(QWidget):
         # Sidebar-Eigenschaften
         self._width = 220  # Initiale Breite
         self.setFixedWidth(self._width)
+        self.animation_mode = "snapshot"  # "snapshot": Content während der Animation einfrieren, "live": jedes Frame neu layouten
+        self.animation = None
+        self.animation_stats = []  # Frame-Statistik pro Toggle, neueste zuletzt
+        self._frame_timer = FrameTimer()
+        self._snapshot = None
         self.nav_button_size = QSize(40, 40)  # Einheitliche Button-Größe
         self.setObjectName("Sidebar")
 
@@ -53,24 +71,24 @@ class Sidebar(QWidget):
         self.layout.addWidget(self.top_bar)
 
         # Menüeinträge
-        self.menu = [
-            {"title": "Home", "view_key": "home", "icon": "workschedule_generator", "submenu": []},
-            {"title": "Settings", "view_key": None, "icon": "settings", "submenu": [
-                {"title": "Example 2", "view_key": "example1", "icon": "template"},
-                {"title": "Example 3", "view_key": "example2", "icon": "workschedule_generator"},
-            ]},
-            {"title": "Example 4", "view_key": "example3", "icon": "template", "submenu": []},
-        ]
-
-        self.nav_buttons = {}
+        self.menu_model = menu_model if menu_model is not None else MenuModel.from_spec(DEFAULT_MENU)
+
+        self.nav_buttons = {}  # Hauptmenüpunkt (MenuNode) -> Button
         self.menu_arrows: [QLabel] = []
+        self.view_key_buttons = {}  # view_key -> Button (beliebige Ebene)
+        self._selected_buttons = set()  # zuletzt hervorgehobene Buttons
+        self.context_menus = {}  # Submenü (MenuNode) -> wiederverwendetes NavContextMenu
+        self.hover_tracker = HoverTracker(parent=self)  # schließt das offene Kontextmenü nach Verlassen
+        self._menu_widgets = []  # Buttons und Submenü-Container in Layout-Reihenfolge
+        self._menu_dirty = False  # MenuModel geändert, Buttons noch nicht neu gebaut
+        self.menu_model.listeners.append(self._on_menu_model_changed)
         self.generate_menu()
 
         # Stretch für flexible Layout-Anpassung
         self.layout.addStretch()
 
         # Callback um die Icons zu färben
-        icon_store.icon_update_callbacks.append(IconUpdateCallback(lambda: self.highlight_nav_button(self.main_window.current_view)))
+        icon_store.icon_update_callbacks.append(IconUpdateCallback(lambda: self.highlight_nav_button(self.main_window.current_view, retint=True)))
 
         # Standard-Button hervorheben
         self.update_menu_visibility()
@@ -91,84 +109,163 @@ class Sidebar(QWidget):
         end_width = 220 if self.expanded else 50
 
         # Animation für die Breite
-        self.animation = QPropertyAnimation(self, b"sidebar_width")
-        self.animation.setDuration(80)
+        if self.animation is None:
+            self.animation = QPropertyAnimation(self, b"sidebar_width", self)
+            self.animation.setDuration(80)
+            self.animation.valueChanged.connect(self._on_animation_frame)
+            # Widgets erst nach Abschluss der Animation aktualisieren
+            self.animation.finished.connect(self._on_animation_finished)
+        elif self.animation.state() == QPropertyAnimation.Running:
+            self.animation.stop()
+            self._end_snapshot()
+
         self.animation.setStartValue(start_width)
         self.animation.setEndValue(end_width)
+        if self.animation_mode == "snapshot":
+            self._begin_snapshot()
+        self._frame_timer.start()
         self.animation.start()
 
-        # Widgets erst nach Abschluss der Animation aktualisieren
-        self.animation.finished.connect(self.update_menu_visibility)
+    def _begin_snapshot(self):
+        """Content-Bereich durch ein Standbild ersetzen, bis die Animation fertig ist."""
+        content_area = getattr(self.main_window, "content_area", None)
+        if content_area is None or not content_area.isVisible():
+            return
+        if self._snapshot is None:
+            self._snapshot = QLabel(content_area.parentWidget())
+            self._snapshot.setObjectName("ContentArea")  # gleicher Hintergrund wie der Content
+            self._snapshot.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self._snapshot.setPixmap(content_area.grab())
+        geometry = content_area.geometry()
+        geometry.setWidth(geometry.width() + abs(220 - 50))  # keine Lücke beim Einklappen
+        self._snapshot.setGeometry(geometry)
+        self._snapshot.raise_()
+        self._snapshot.show()
+
+        # Kein Relayout, Repaint oder Schatten-Rendering des Contents pro Frame
+        content_area.setUpdatesEnabled(False)
+        content_area.layout().setEnabled(False)
+        effect = content_area.graphicsEffect()
+        if effect is not None:
+            effect.setEnabled(False)
+
+    def _end_snapshot(self):
+        """Content wieder freigeben: ein einziges Relayout am Ende."""
+        if self._snapshot is None or not self._snapshot.isVisible():
+            return
+        content_area = self.main_window.content_area
+        content_area.layout().setEnabled(True)
+        content_area.layout().activate()
+        effect = content_area.graphicsEffect()
+        if effect is not None:
+            effect.setEnabled(True)
+        content_area.setUpdatesEnabled(True)
+        self._snapshot.hide()
+        self._snapshot.clear()
+
+    def _on_animation_frame(self, width):
+        self._frame_timer.frame()
+        if self._snapshot is not None and self._snapshot.isVisible():
+            self._snapshot.move(width, self._snapshot.y())
+
+    def _on_animation_finished(self):
+        stats = self._frame_timer.stop(mode=self.animation_mode, expanded=self.expanded)
+        self.animation_stats.append(stats)
+        del self.animation_stats[:-20]
+        self._end_snapshot()
+        self.update_menu_visibility()
 
     def update_menu_visibility(self):
         """Aktualisiert die Sichtbarkeit und den Text von Buttons basierend auf dem Sidebar-Zustand."""
+        with ui_batch(self):
+            self._update_menu_visibility()
+
+    def _update_menu_visibility(self):
+        if self.expanded:
+            self.hover_tracker.close()
+
         # Passe die Top-Bar-Ausrichtung an
         self.top_bar_layout.setDirection(QVBoxLayout.TopToBottom if not self.expanded else QHBoxLayout.LeftToRight)
 
-        for item in self.menu:
-            button = self.nav_buttons.get(item["title"])
+        for node, button in self.nav_buttons.items():
             if button:
                 if self.expanded:
                     # Großer Sidebar-Zustand
-                    button.setText(item["title"])
+                    button.setText(node.title)
                     button.setIconSize(QSize(24, 24))
-                    if item["submenu"]:
+                    if node.children:
                         submenu_container = button.property("submenu_container")
                         if submenu_container:
                             submenu_container.setVisible(True)
                             button.setEnabled(False)  # Hauptmenü nicht anklickbar
-
-                    # alle Pfeile verstecken
-                    for label_arrow in self.menu_arrows:
-                        label_arrow.setVisible(False)
                 else:
                     # Eingeklappter Sidebar-Zustand
                     button.setText("")  # Entferne Text im eingeklappten Zustand
                     button.setIconSize(QSize(32, 32))
-                    if item["submenu"]:
+                    if node.children:
                         submenu_container = button.property("submenu_container")
                         if submenu_container:
                             submenu_container.setVisible(False)
                             button.setEnabled(True)  # Hauptmenü anklickbar
-                    icon_store.update_icons(theme_store.dark_mode)  # fixt die Button-Größe
 
-                    # alle Pfeile anzeigen
-                    for label_arrow in self.menu_arrows:
-                        label_arrow.setVisible(True)
+        # Pfeile nur im eingeklappten Zustand anzeigen
+        for label_arrow in self.menu_arrows:
+            label_arrow.setVisible(not self.expanded)
 
-        self.highlight_nav_button(self.main_window.current_view)
+        # Einmaliges Icon-Update: Icons liegen in Registrierungsgröße im Cache,
+        # daher genügt das Neufärben statt icon_store.update_icons pro Menüpunkt
+        self.highlight_nav_button(self.main_window.current_view, retint=True)
 
     def generate_menu(self):
-        """Generiert das Menü basierend auf der Menüstruktur."""
-        for item in self.menu:
-            if not item["submenu"]:
-                self.add_nav_button(item["title"], item["view_key"], item["icon"])
+        """Generiert das Menü basierend auf dem MenuModel."""
+        for node in self.menu_model.roots:
+            if not node.children:
+                self.add_nav_button(node)
             else:
-                self.add_submenu(item["title"], item["submenu"], item["icon"])
+                self.add_submenu(node)
+
+    def rebuild_menu(self):
+        """Baut die Menü-Buttons nach Änderungen am MenuModel neu auf."""
+        self._menu_dirty = False
+        for widget in self._menu_widgets:
+            self.layout.removeWidget(widget)
+            widget.deleteLater()
+        self._menu_widgets.clear()
+        self.nav_buttons.clear()
+        self.view_key_buttons.clear()
+        self.menu_arrows.clear()
+        self._selected_buttons = set()
+        self.generate_menu()
+        self.update_menu_visibility()
+
+    def _add_menu_widget(self, widget):
+        # Direkt hinter der Top-Bar und vor dem Stretch einfügen
+        self.layout.insertWidget(1 + len(self._menu_widgets), widget)
+        self._menu_widgets.append(widget)
 
-    def add_nav_button(self, label, view_key, icon_name):
+    def add_nav_button(self, node):
         """Fügt einen Navigations-Button hinzu."""
         button = QPushButton()
         button.setObjectName("NavButton")
         button.setProperty("selected", False)
-        button.setIcon(icon_store.load_iconify_icon(icon_name=icon_name, dark_mode=theme_store.dark_mode, widget=button))
-        button.clicked.connect(lambda: self.set_view(view_key))
-        self.nav_buttons[label] = button
-        self.layout.addWidget(button)
-
-    def add_submenu(self, title, submenu_items, icon_name):
+        button.setIcon(icon_store.load_iconify_icon(icon_name=node.icon, dark_mode=theme_store.dark_mode, widget=button))
+        button.clicked.connect(lambda: self.set_view(node.view_key))
+        self.nav_buttons[node] = button
+        if node.view_key is not None:
+            self.view_key_buttons[node.view_key] = button
+        self._add_menu_widget(button)
+
+    def add_submenu(self, node):
         """Fügt Title und seine Submenüs hinzu."""
         # Hauptbutton für Submenü
         button = QPushButton()
         button.setObjectName("SubmenuTitle")
         button.setProperty("selected", False)
-        button.setIcon(icon_store.load_iconify_icon(icon_name=icon_name, dark_mode=theme_store.dark_mode, widget=button))
+        button.setIcon(icon_store.load_iconify_icon(icon_name=node.icon, dark_mode=theme_store.dark_mode, widget=button))
 
         # Pfeil neben Hauptmenu
         overlay_icon = QLabel(button)
-        # overlay_pixmap = QPixmap("assets/icons/arrow_menu_open.svg").scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        # overlay_icon.setPixmap(overlay_pixmap)
-        overlay_icon.setPixmap(icon_store.load_iconify_icon(icon_name="arrow_menu_open", dark_mode=theme_store.dark_mode, widget=overlay_icon, size=24).pixmap(QSize(24, 24)))
+        overlay_icon.setPixmap(icon_store.load_iconify_icon(icon_name="arrow_menu_open", dark_mode=theme_store.dark_mode, widget=overlay_icon, size=24).pixmap(QSize(24, 24), overlay_icon.devicePixelRatioF()))
         overlay_icon.setFixedSize(18, 18)
         overlay_icon.setAttribute(Qt.WA_TranslucentBackground)
         overlay_icon.setStyleSheet("padding: 0px; margin: 0px;")
@@ -176,138 +273,148 @@ class Sidebar(QWidget):
         self.menu_arrows.append(overlay_icon)
         button.setProperty("overlay_icon_arrow", overlay_icon)
 
-        self.nav_buttons[title] = button
-        self.layout.addWidget(button)
+        self.nav_buttons[node] = button
+        if node.view_key is not None:
+            self.view_key_buttons[node.view_key] = button
+        self._add_menu_widget(button)
 
         # Submenü-Container für große Sidebar
         submenu_container = QWidget()
         submenu_layout = QVBoxLayout(submenu_container)
         submenu_layout.setContentsMargins(10, 0, 0, 0)
         submenu_layout.setSpacing(5)
+        self.add_submenu_entries(submenu_layout, node.children)
 
-        for item in submenu_items:
-            submenu_button = QPushButton(item["title"])
-            submenu_button.setObjectName("SubNavButton")
-            submenu_button.setProperty('view_key', item["view_key"])
-            submenu_button.setIcon(icon_store.load_iconify_icon(icon_name=item["icon"], dark_mode=theme_store.dark_mode, widget=submenu_button))
-            # submenu_button.setFixedHeight(self.nav_button_size.height())  # Gleiche Höhe wie Hauptmenüs
-            submenu_button.clicked.connect(lambda _, key=item["view_key"]: self.set_view(key))
-            submenu_layout.addWidget(submenu_button)
-
-        self.layout.addWidget(submenu_container)
+        self._add_menu_widget(submenu_container)
         button.setProperty("submenu_container", submenu_container)
-        button.setProperty("submenu_items", submenu_items)
-        button.setProperty("context_is_open", False)
-        button.setProperty("mouse_pos", 0)
+        button.setProperty("submenu_node", node)
         button.setAttribute(Qt.WA_Hover, True)
         button.installEventFilter(self)
 
-        # Kontextmenü für kleine Sidebar
-        # button.clicked.connect(lambda: self.show_context_menu(button, submenu_items) if not self.expanded else None)
+    def add_submenu_entries(self, submenu_layout, nodes):
+        """Fügt Submenü-Einträge hinzu; tiefere Ebenen werden eingerückt verschachtelt."""
+        for node in nodes:
+            submenu_button = QPushButton(node.title)
+            submenu_button.setObjectName("SubNavButton")
+            submenu_button.setProperty("view_key", node.view_key)
+            submenu_button.setIcon(icon_store.load_iconify_icon(icon_name=node.icon, dark_mode=theme_store.dark_mode, widget=submenu_button))
+            submenu_button.setProperty("selected", False)
+            if node.view_key is not None:
+                submenu_button.clicked.connect(lambda _, key=node.view_key: self.set_view(key))
+                self.view_key_buttons[node.view_key] = submenu_button
+            else:
+                submenu_button.setEnabled(False)  # reine Gruppe
+            submenu_layout.addWidget(submenu_button)
+
+            if node.children:
+                nested_container = QWidget()
+                nested_layout = QVBoxLayout(nested_container)
+                nested_layout.setContentsMargins(10, 0, 0, 0)
+                nested_layout.setSpacing(5)
+                self.add_submenu_entries(nested_layout, node.children)
+                submenu_layout.addWidget(nested_container)
 
     def eventFilter(self, obj, event):
-        if isinstance(obj, QPushButton) and obj.objectName() == "SubmenuTitle" and not self.expanded:
-            submenu = obj.property("submenu")
-            submenu_container = obj.property("submenu_container")
-            submenu_items_prop = obj.property("submenu_items")
-            context_is_open = obj.property("context_is_open")
-
-            if submenu_container is not None:
-                if event.type() == QEvent.HoverEnter and not context_is_open:
-                    obj.setProperty("context_is_open", True)
-                    submenu = self.show_context_menu(obj, submenu_items_prop)
-                    submenu.setProperty("parent_button", obj)
-                    obj.setProperty("submenu", submenu)
-                elif event.type() == QEvent.HoverLeave and context_is_open and submenu:
-                    global_pos = QCursor.pos()
-                    button_geometry = QRect(obj.mapToGlobal(QPoint(0, 0)), obj.size())
-                    if not submenu.geometry().contains(global_pos) and not button_geometry.contains(global_pos):
-                        submenu.close()
-                        obj.setProperty("context_is_open", False)
-                        obj.setProperty("submenu", None)
-                    # self.closeContextMenu()
+        # Nur HoverEnter öffnet das Kontextmenü; das Schließen übernimmt der HoverTracker
+        if event.type() == QEvent.HoverEnter and not self.expanded and obj.objectName() == "SubmenuTitle":
+            submenu_node = obj.property("submenu_node")
+            if submenu_node is not None and not self.hover_tracker.is_open(self.context_menus.get(submenu_node)):
+                self.show_context_menu(obj, submenu_node)
         return super().eventFilter(obj, event)
 
-    def show_context_menu(self, button, submenu_items):
+    def show_context_menu(self, button, submenu_node):
         """Zeigt ein Kontextmenü für Submenüelemente."""
         if self.expanded:
             return  # Kein Kontextmenü, wenn Sidebar groß ist
 
-        menu = NavContextMenu()
-        menu.setObjectName("NavContextMenu")
-        for item in submenu_items:
-            submenu_button = menu.add_action(item["title"], icon=item["icon"], callback=lambda key=item["view_key"]: self.set_view(key))
-
-            # Prüfen, ob Submenü aktiv ist
-            is_active = item["view_key"] == self.main_window.current_view
-            if is_active:
-                submenu_button.setProperty("active", True)
-                submenu_button.style().unpolish(submenu_button)
-                submenu_button.style().polish(submenu_button)
-                submenu_button.update()
-                icon_store.update_icon_color_from_func(submenu_button, lambda: submenu_button.palette().color(submenu_button.foregroundRole()))
-
-            # Verbindung für Klick
-            #action.triggered.connect(lambda _, key=item["view_key"]: self.set_view(key))
+        menu = self.context_menu_for(submenu_node)
+        menu.set_active_key(self.main_window.current_view)
 
         pos = button.mapToGlobal(button.rect().topRight())
         pos.setX(pos.x() + 1)
         menu.show_menu(pos)
+        self.hover_tracker.watch(menu, button)
         return menu
 
+    def context_menu_for(self, submenu_node):
+        """Liefert das (einmalig erzeugte) Kontextmenü eines Submenüs."""
+        menu = self.context_menus.get(submenu_node)
+        if menu is None:
+            menu = NavContextMenu()
+            menu.setObjectName("NavContextMenu")
+            for item in submenu_node.leaves():
+                menu.add_action(item.title, icon=item.icon, callback=lambda key=item.view_key: self.set_view(key), view_key=item.view_key)
+            self.context_menus[submenu_node] = menu
+        return menu
+
+    def _on_menu_model_changed(self, event, node):
+        """Kontextmenü des betroffenen Submenüs verwerfen und die Buttons gebündelt neu bauen.
+
+        Das Kontextmenü entsteht beim nächsten Hover neu; die Buttons im nächsten
+        Event-Loop-Durchlauf oder spätestens beim nächsten Hervorheben.
+        """
+        menu = self.context_menus.pop(node.root, None)
+        if menu is not None:
+            if self.hover_tracker.popup is menu:
+                self.hover_tracker.close()
+            menu.close()
+            menu.deleteLater()
+        if not self._menu_dirty:
+            self._menu_dirty = True
+            QTimer.singleShot(0, self, self._rebuild_if_dirty)
+
+    def _rebuild_if_dirty(self):
+        if self._menu_dirty:
+            self.rebuild_menu()
+
     def set_view(self, view_key):
         """Wechselt die Ansicht."""
         if view_key:
             self.main_window.set_view(view_key)
 
-    def highlight_nav_button(self, active_key):
-        """Hebt den aktiven Button hervor."""
-        for item in self.menu:
-            # Hauptmenüpunkt
-            button = self.nav_buttons.get(item["title"])
-            if not button:
-                continue
-
-            # Prüfen, ob der Hauptmenüpunkt aktiv ist oder eines seiner Submenüs aktiv ist
-            is_active = item["view_key"] == active_key
-            submenu_active = any(sub["view_key"] == active_key for sub in item.get("submenu", []))
-
-            # Hauptmenüpunkt: Aktiv, wenn selbst aktiv oder (im kleinen Zustand) eines der Submenüs aktiv ist
-            button_active = is_active or (submenu_active and not self.expanded)
-            button.setProperty("selected", button_active)
-            """refresh style"""
-            button.style().unpolish(button)
-            button.style().polish(button)
-            button.update()
-
-            overlay_icon_arrow = button.property("overlay_icon_arrow")
-            if overlay_icon_arrow is not None:
-                icon_store.update_icon_color_from_func(overlay_icon_arrow, lambda: button.palette().color(button.foregroundRole()))
-                overlay_icon_arrow.style().unpolish(button)
-                overlay_icon_arrow.style().polish(button)
-                overlay_icon_arrow.update()
-
-            """Color Icon"""
-            icon_store.update_icon_color_from_func(button, lambda: button.palette().color(button.foregroundRole()))
-
-            # Submenüs: Nur im großen Zustand aktiv
-            if item.get("submenu"):
-                if self.expanded:
-                    submenu_container = button.property("submenu_container")
-                    if submenu_container:
-                        for i in range(submenu_container.layout().count()):
-                            submenu_button = submenu_container.layout().itemAt(i).widget()
-                            submenu_button_view_key = submenu_button.property("view_key")
-                            if submenu_button:
-                                # Prüfen, ob Submenü aktiv ist
-                                submenu_active = submenu_button_view_key == active_key
-                                submenu_button.setProperty("selected", submenu_active)
-                                """refresh style"""
-                                submenu_button.style().unpolish(submenu_button)
-                                submenu_button.style().polish(submenu_button)
-                                submenu_button.update()
-                                # update icon
-                                icon_store.update_icon_color_from_func(submenu_button, lambda: submenu_button.palette().color(submenu_button.foregroundRole()))
+    def highlight_nav_button(self, active_key, retint=False):
+        """Hebt den aktiven Button hervor.
+
+        Nur Buttons, deren Zustand sich geändert hat, werden neu gestylt und
+        eingefärbt; `retint` färbt zusätzlich alle Icons neu (z.B. nach Theme-Wechsel).
+        """
+        if self._menu_dirty:
+            self.rebuild_menu()
+        selected = set()
+        button = self.view_key_buttons.get(active_key)
+        if button is not None:
+            selected.add(button)
+        # Hauptmenüpunkt im kleinen Zustand aktiv, wenn eines seiner Submenüs aktiv ist
+        ancestors = self.menu_model.ancestors(active_key)
+        if ancestors and not self.expanded:
+            selected.add(self.nav_buttons[ancestors[0]])
+
+        changed = selected ^ self._selected_buttons
+        self._selected_buttons = selected
+        if not changed and not retint:
+            return
+
+        # Repaints bündeln: ein Update der Sidebar statt eines pro Button,
+        # Repolish und Einfärben je Button nur einmal
+        with ui_batch(self):
+            for button in changed:
+                button.setProperty("selected", button in selected)
+                repolish(button)
+
+            for button in (self.all_menu_buttons() if retint else changed):
+                self._tint_button(button)
+
+    def all_menu_buttons(self):
+        """Alle Menü-Buttons (Hauptmenü und Submenüs), jeweils einmal."""
+        return set(self.nav_buttons.values()) | set(self.view_key_buttons.values())
+
+    @staticmethod
+    def _tint_button(button):
+        """Färbt Icon (und ggf. Pfeil) in der aktuellen Textfarbe des Buttons."""
+        icon_store.update_icon_color_from_func(button, lambda: button.palette().color(button.foregroundRole()))
+        overlay_icon_arrow = button.property("overlay_icon_arrow")
+        if overlay_icon_arrow is not None:
+            icon_store.update_icon_color_from_func(overlay_icon_arrow, lambda: button.palette().color(button.foregroundRole()))
 
     @staticmethod
     def toggle_theme():
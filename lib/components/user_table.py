@@ -0,0 +1,248 @@
+from itertools import count
+
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, QSortFilterProxyModel, Qt, Signal
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QComboBox, QStyledItemDelegate
+
+NAME_COLUMN, AGE_COLUMN, ACTIONS_COLUMN = range(3)
+COLUMNS = ("Name", "Age", "Actions")
+AGE_CHOICES = ("18", "25", "30", "35", "40", "50")
+
+RowIdRole = Qt.UserRole + 1
+
+# Enum attribute lookups are slow in PySide6; resolve the ones used per cell once
+_DISPLAY_ROLE, _EDIT_ROLE, _ALIGNMENT_ROLE = Qt.DisplayRole, Qt.EditRole, Qt.TextAlignmentRole
+_SELECTABLE = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+_EDITABLE = _SELECTABLE | Qt.ItemIsEditable
+_AGE_ALIGNMENT = int(Qt.AlignRight | Qt.AlignVCenter)
+
+MAX_REMOVE_RANGES = 32  # above this many separate ranges a removal resets the model
+
+DELETE_ICON_SIZE = 16
+
+
+class UserTableModel(QAbstractTableModel):
+    """User records as a flat list of [row_id, name, age].
+
+    Every record gets a row id that stays valid while other rows are inserted
+    or removed; use it instead of row numbers to refer to a record.
+    """
+
+    def __init__(self, records=(), parent=None):
+        super().__init__(parent)
+        self.editable = False
+        self._rows = []
+        self._row_of = {}  # row_id -> row, rebuilt after removals
+        self._ids = count(1)
+        self.loader = None  # RowLoader feeding fetchMore(), see lib/utils/row_loader.py
+        self.rejected_records = []  # malformed (name, age) records skipped by insert_records()
+        self.sort_key = None  # (column, order) of the last sort; new records are sorted in
+        self.insert_records(records)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loader is not None and self.loader.can_fetch_more()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.loader is not None:
+            self.loader.fetch_more()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        return _EDITABLE if self.editable and index.column() != ACTIONS_COLUMN else _SELECTABLE
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == _DISPLAY_ROLE or role == _EDIT_ROLE:
+            if column == NAME_COLUMN:
+                return row[1]
+            if column == AGE_COLUMN:
+                return row[2] if role == _DISPLAY_ROLE else str(row[2])
+        elif role == RowIdRole:
+            return row[0]
+        elif role == _ALIGNMENT_ROLE and column == AGE_COLUMN:
+            return _AGE_ALIGNMENT
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or index.column() not in (NAME_COLUMN, AGE_COLUMN):
+            return False
+        row = self._rows[index.row()]
+        if index.column() == AGE_COLUMN:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                return False
+        if row[index.column() + 1] == value:
+            return True
+        row[index.column() + 1] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the records in Python; much cheaper than a proxy calling `data()` per comparison.
+
+        Records inserted later are sorted in as well; any other column keeps insertion order from now on.
+        """
+        if column not in (NAME_COLUMN, AGE_COLUMN):
+            self.sort_key = None
+            return
+        self.sort_key = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_ids = [self._rows[index.row()][0] for index in persistent]
+        self._rows.sort(key=lambda row: row[column + 1], reverse=order == Qt.DescendingOrder)
+        self._row_of = {row[0]: position for position, row in enumerate(self._rows)}
+        self.changePersistentIndexList(persistent, [self.index(self._row_of[row_id], index.column()) for row_id, index in zip(persistent_ids, persistent)])
+        self.layoutChanged.emit()
+
+    def set_editable(self, editable):
+        """Toggle edit mode; only the actions column is repainted."""
+        self.editable = editable
+        if self._rows:
+            self.dataChanged.emit(self.index(0, ACTIONS_COLUMN), self.index(len(self._rows) - 1, ACTIONS_COLUMN))
+
+    def insert_records(self, records):
+        """Append (name, age) records in one batch and return their row ids.
+
+        Malformed records (wrong field count, non-numeric age) are skipped and
+        kept in `rejected_records`, so one bad CSV line does not stop an import.
+        """
+        new_rows = []
+        for record in records:
+            try:
+                name, age = record
+                new_rows.append([next(self._ids), name, int(age)])
+            except (TypeError, ValueError):
+                self.rejected_records.append(record)
+        if not new_rows:
+            return []
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self._row_of.update((row[0], first + offset) for offset, row in enumerate(new_rows))
+        self.endInsertRows()
+        if self.sort_key is not None:
+            self.sort(*self.sort_key)  # sorted rows plus one new chunk: cheap for Timsort
+        return [row[0] for row in new_rows]
+
+    def remove_ids(self, row_ids):
+        """Remove records by row id; contiguous rows are removed as one range."""
+        rows = sorted({self._row_of[row_id] for row_id in row_ids if row_id in self._row_of}, reverse=True)
+        if not rows:
+            return 0
+        ranges = []
+        # Back to front so earlier rows keep their position
+        start = end = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == start - 1:
+                start = row
+                continue
+            ranges.append((start, end))
+            if row is not None:
+                start = end = row
+        if len(ranges) > MAX_REMOVE_RANGES:
+            # Many scattered rows: one reset is cheaper than a signal per range for views and proxies
+            removed = set(rows)
+            self.beginResetModel()
+            self._rows = [row for position, row in enumerate(self._rows) if position not in removed]
+            self.endResetModel()
+        else:
+            for start, end in ranges:
+                self.beginRemoveRows(QModelIndex(), start, end)
+                del self._rows[start:end + 1]
+                self.endRemoveRows()
+        self._row_of = {row[0]: position for position, row in enumerate(self._rows)}
+        return len(rows)
+
+    def row_for_id(self, row_id):
+        """Current row of a record, or -1 if it was removed."""
+        return self._row_of.get(row_id, -1)
+
+    def folded_name(self, row):
+        return self._rows[row][1].casefold()
+
+    def record(self, row_id):
+        row = self._rows[self._row_of[row_id]]
+        return row[1], row[2]
+
+
+class UserFilterProxyModel(QSortFilterProxyModel):
+    """Sorts by any column and filters case-insensitively by name."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_text = ""
+
+    def set_filter_text(self, text):
+        text = text.casefold()
+        if text != self.filter_text:
+            self.filter_text = text
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # Reads the source list directly instead of going through data()
+        return not self.filter_text or self.filter_text in self.sourceModel().folded_name(source_row)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Sort the source model and pass its order through unchanged
+        self.sourceModel().sort(column, order)
+        super().sort(-1, Qt.AscendingOrder)  # -1 with DescendingOrder would reverse the source order again
+
+
+class DeleteActionDelegate(QStyledItemDelegate):
+    """Paints the trash icon of the actions column and reports clicks by row id."""
+    delete_requested = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.icons = {False: QIcon("assets/icons/trash_gray.png"), True: QIcon("assets/icons/trash_red.png")}
+
+    @staticmethod
+    def icon_rect(rect):
+        return QRect(rect.center().x() - DELETE_ICON_SIZE // 2, rect.center().y() - DELETE_ICON_SIZE // 2, DELETE_ICON_SIZE, DELETE_ICON_SIZE)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        editable = index.model().flags(index.siblingAtColumn(NAME_COLUMN)) & Qt.ItemIsEditable
+        self.icons[bool(editable)].paint(painter, self.icon_rect(option.rect))
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if self.icon_rect(option.rect).contains(event.position().toPoint()):
+                self.delete_requested.emit(index.data(RowIdRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class AgeComboDelegate(QStyledItemDelegate):
+    """Edits the age column with a combo box that commits on selection."""
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(AGE_CHOICES)
+        combo.activated.connect(lambda: self._commit(combo))
+        return combo
+
+    def setEditorData(self, editor, index):
+        value = index.data(Qt.EditRole)
+        if editor.findText(value) < 0:
+            editor.insertItem(0, value)  # keep an age outside AGE_CHOICES instead of showing (and saving) the first choice
+        editor.setCurrentText(value)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+    def _commit(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
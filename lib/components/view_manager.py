@@ -0,0 +1,142 @@
+import importlib
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, QTimer
+
+WIDGET_COST_ESTIMATE = 2 * 1024  # Bytes per child object, rough default for memory estimates
+
+
+class ViewManager:
+    """Creates views from factories and keeps a bounded number of them alive.
+
+    Views may implement optional lifecycle hooks:
+      - on_suspend(): the view was hidden, release what is cheap to rebuild
+      - on_resume(): the view is shown again after being suspended
+      - on_evict(): the view is about to be destroyed by the cache
+      - memory_estimate(): bytes used by the view, for `stats()`
+    A view with a truthy `pinned` attribute is never evicted.
+    Factories may be given as "package.module:ClassName" strings; the module is
+    then only imported when the view is first built or `import_factories()` runs.
+    """
+
+    def __init__(self, content_area, content_layout, max_live_views=8):
+        self.content_area = content_area
+        self.content_layout = content_layout
+        self.max_live_views = max_live_views
+        self.factories = {}
+        self.views = OrderedDict()  # view_key -> view, least recently shown first
+        self.current_key = None
+        self.created = 0
+        self.evicted = 0
+
+    def __contains__(self, view_key):
+        return view_key in self.factories
+
+    def register(self, view_key, factory):
+        self.factories[view_key] = factory
+
+    def factory(self, view_key):
+        """Factory for a key; string factories are imported and replaced on first use."""
+        factory = self.factories[view_key]
+        if isinstance(factory, str):
+            module_name, _, attribute = factory.partition(":")
+            factory = self.factories[view_key] = getattr(importlib.import_module(module_name), attribute)
+        return factory
+
+    def import_factories(self, view_keys=None):
+        """Import the modules of string factories now, e.g. after the first paint."""
+        for view_key in view_keys or list(self.factories):
+            self.factory(view_key)
+
+    def get(self, view_key):
+        """Return the view for a key, creating it on first access."""
+        view = self.views.get(view_key)
+        if view is None:
+            view = self.factory(view_key)(self.content_area)
+            view.setVisible(False)
+            self.content_layout.addWidget(view)
+            self.views[view_key] = view
+            self.created += 1
+        return view
+
+    def show(self, view_key):
+        """Hide the current view, show `view_key` and evict views over the limit."""
+        if self.current_key is not None and self.current_key in self.views:
+            previous = self.views[self.current_key]
+            previous.setVisible(False)
+            self._call_hook(previous, "on_suspend")
+
+        resumed = view_key in self.views
+        view = self.get(view_key)
+        view.setVisible(True)
+        if resumed:
+            self._call_hook(view, "on_resume")
+        self.views.move_to_end(view_key)
+        self.current_key = view_key
+
+        self.evict_over_limit()
+        return view
+
+    def prewarm(self, view_keys=None):
+        """Create not yet built views one at a time whenever the event loop is idle."""
+        pending = [key for key in (view_keys or self.factories) if key not in self.views]
+        pending = pending[:max(0, self.max_live_views - len(self.views))]
+
+        def build_next():
+            while pending:
+                key = pending.pop(0)
+                if key not in self.views:
+                    self.get(key)
+                    break
+            if pending:
+                QTimer.singleShot(0, build_next)
+
+        if pending:
+            QTimer.singleShot(0, build_next)
+
+    def evict_over_limit(self):
+        """Evict least recently shown, hidden, unpinned views until the limit is met."""
+        for view_key in list(self.views):
+            if len(self.views) <= self.max_live_views:
+                break
+            if view_key != self.current_key and not getattr(self.views[view_key], "pinned", False):
+                self.evict(view_key)
+
+    def evict(self, view_key):
+        """Destroy a cached view; it is rebuilt from its factory on next use."""
+        if view_key == self.current_key:
+            return False
+        view = self.views.pop(view_key, None)
+        if view is None:
+            return False
+        self._call_hook(view, "on_evict")
+        self.content_layout.removeWidget(view)
+        view.deleteLater()
+        self.evicted += 1
+        return True
+
+    def stats(self):
+        """Live view count and memory estimates per view."""
+        memory = {key: self.memory_estimate(view) for key, view in self.views.items()}
+        return {
+            "live_views": len(self.views),
+            "max_live_views": self.max_live_views,
+            "created": self.created,
+            "evicted": self.evicted,
+            "pinned": [key for key, view in self.views.items() if getattr(view, "pinned", False)],
+            "memory_estimate": sum(memory.values()),
+            "memory_per_view": memory,
+        }
+
+    @staticmethod
+    def memory_estimate(view):
+        estimate = getattr(view, "memory_estimate", None)
+        if callable(estimate):
+            return estimate()
+        return (len(view.findChildren(QObject)) + 1) * WIDGET_COST_ESTIMATE
+
+    @staticmethod
+    def _call_hook(view, name):
+        hook = getattr(view, name, None)
+        if callable(hook):
+            hook()
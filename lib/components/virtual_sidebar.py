@@ -0,0 +1,265 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QIcon
+from PySide6.QtWidgets import QAbstractItemView, QHBoxLayout, QLineEdit, QStyle, QStyledItemDelegate, QListView, QVBoxLayout
+
+from lib.components.sidebar import Sidebar
+from lib.stores.icon_store import icon_store
+from lib.stores.theme_store import theme_store
+
+NodeRole = Qt.UserRole + 1
+ViewKeyRole = Qt.UserRole + 2
+ActiveRole = Qt.UserRole + 3
+
+ROW_HEIGHT = 40
+
+
+class NavListModel(QAbstractListModel):
+    """Flache Qt-Liste der sichtbaren Einträge eines MenuModel.
+
+    Im großen Zustand enthält sie alle (gefilterten) Einträge in Baumreihenfolge,
+    im kleinen nur die Hauptmenüpunkte. Der Aktiv-Zustand ist eine Rolle.
+    """
+
+    def __init__(self, menu_model, parent=None):
+        super().__init__(parent)
+        self.menu_model = menu_model
+        self.active_key = None
+        self.collapsed = False  # im kleinen Zustand gilt der Hauptmenüpunkt des aktiven Eintrags als aktiv
+        self.filter_text = ""
+        self._nodes = []
+        self._rows = {}
+        self._refresh_pending = False
+        menu_model.listeners.append(self._on_menu_changed)
+        self.refresh()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._nodes)
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled
+
+    def data(self, index, role=Qt.DisplayRole):
+        node = self._nodes[index.row()]
+        if role == Qt.DisplayRole:
+            return node.title
+        if role == NodeRole:
+            return node
+        if role == ViewKeyRole:
+            return node.view_key
+        if role == ActiveRole:
+            return self.is_active(node)
+        if role == Qt.ToolTipRole and self.collapsed:
+            return node.title
+        return None
+
+    def is_active(self, node):
+        if self.active_key is None:
+            return False
+        if node.view_key == self.active_key:
+            return True
+        active = self.menu_model.node(self.active_key)
+        return self.collapsed and active is not None and bool(active.ancestors) and active.ancestors[0] is node
+
+    def index_for_node(self, node):
+        row = self._rows.get(node)
+        return self.index(row, 0) if row is not None else QModelIndex()
+
+    def set_active_key(self, view_key):
+        """Setzt den aktiven Eintrag und meldet nur die betroffenen Zeilen."""
+        previous = self.active_key
+        self.active_key = view_key
+        for key in {previous, view_key}:
+            node = self.menu_model.node(key)
+            if node is None:
+                continue
+            for affected in (node,) + node.ancestors[:1]:
+                index = self.index_for_node(affected)
+                if index.isValid():
+                    self.dataChanged.emit(index, index, [ActiveRole])
+
+    def set_collapsed(self, collapsed):
+        self.collapsed = collapsed
+        self.refresh()
+
+    def set_filter(self, text):
+        self.filter_text = text.casefold()
+        self.refresh()
+
+    def refresh(self):
+        """Sichtbare Zeilen neu berechnen (O(n), ohne Qt-Aufrufe pro Eintrag)."""
+        if self.collapsed:
+            nodes = list(self.menu_model.roots)
+        elif not self.filter_text:
+            nodes = list(self.menu_model)
+        else:
+            # Treffer und deren Vorfahren in Baumreihenfolge behalten
+            keep = set()
+            for node in self.menu_model:
+                if self.filter_text in node.title.casefold():
+                    keep.add(node)
+                    keep.update(node.ancestors)
+            nodes = [node for node in self.menu_model if node in keep]
+        self.beginResetModel()
+        self._nodes = nodes
+        self._rows = {node: row for row, node in enumerate(nodes)}
+        self.endResetModel()
+
+    def _on_menu_changed(self, event, node):
+        # Änderungen am MenuModel gebündelt übernehmen
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._finish_refresh)
+
+    def _finish_refresh(self):
+        self._refresh_pending = False
+        self.refresh()
+
+
+class NavItemDelegate(QStyledItemDelegate):
+    """Zeichnet Menüzeilen direkt (Icon, Text, Hover/Aktiv) ohne Widgets pro Zeile."""
+
+    def __init__(self, sidebar):
+        super().__init__(sidebar)
+        self.sidebar = sidebar
+        self.font = QFont()
+        self.font.setPixelSize(15)
+        self.font.setWeight(QFont.DemiBold)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        node = index.data(NodeRole)
+        active = index.data(ActiveRole)
+        tokens = theme_store.stylesheets.theme(theme_store.theme)["tokens"]
+        expanded = self.sidebar.expanded
+        rect = option.rect
+
+        painter.save()
+        if option.state & QStyle.State_MouseOver:
+            painter.fillRect(QRect(0, rect.y(), rect.right() + 1, rect.height()), QColor(tokens["hover_bg"]))
+
+        icon_size = 24 if expanded else 32
+        color = tokens["submenu_title"] if node.children else tokens["nav_text"]
+        icon = icon_store.load_iconify_icon(node.icon, theme_store.dark_mode, size=icon_size, color=color, selected_color=tokens["accent"])
+        left = rect.x() + (10 + 10 * node.depth if expanded else (rect.width() - icon_size) // 2)
+        icon_rect = QRect(left, rect.y() + (rect.height() - icon_size) // 2, icon_size, icon_size)
+        icon.paint(painter, icon_rect, Qt.AlignCenter, QIcon.Selected if active else QIcon.Normal)
+
+        if expanded:
+            painter.setFont(self.font)
+            painter.setPen(QColor(tokens["accent"] if active else color))
+            text_rect = QRect(icon_rect.right() + 8, rect.y(), rect.right() - icon_rect.right() - 8, rect.height())
+            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, painter.fontMetrics().elidedText(node.title, Qt.ElideRight, text_rect.width()))
+        elif node.children:
+            arrow = icon_store.load_iconify_icon("arrow_menu_open", theme_store.dark_mode, size=16, color=color, selected_color=tokens["accent"])
+            arrow.paint(painter, QRect(icon_rect.right() - 6, icon_rect.y() + 8, 16, 16), Qt.AlignCenter, QIcon.Selected if active else QIcon.Normal)
+        painter.restore()
+
+
+class VirtualSidebar(Sidebar):
+    """Sidebar-Backend für sehr große Menüs: QListView über NavListModel.
+
+    Nur sichtbare Zeilen werden gezeichnet; Einklappen, Hervorheben und
+    Kontextmenüs verhalten sich wie bei `Sidebar`.
+    """
+
+    def generate_menu(self):
+        """Erzeugt Filterfeld und Listenansicht statt eines Buttons pro Eintrag."""
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.set_filter)
+        self.layout.addWidget(self.filter_edit)
+
+        self.list_model = NavListModel(self.menu_model, self)
+
+        self.list_view = QListView()
+        self.list_view.setObjectName("NavList")
+        self.list_view.setItemDelegate(NavItemDelegate(self))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setFrameShape(QListView.NoFrame)
+        self.list_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.list_view.setFocusPolicy(Qt.NoFocus)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setStyleSheet("QListView#NavList { background: transparent; border: none; }")
+        self.list_view.clicked.connect(self._on_clicked)
+        self.list_view.entered.connect(self._on_entered)
+        self.layout.addWidget(self.list_view, 1)
+        self.list_view.setModel(self.list_model)  # erst nach der Konfiguration, spart Relayouts
+
+        self.context_menu = None
+        self._context_node = None
+
+    def rebuild_menu(self):
+        """Die Liste folgt dem MenuModel selbst (NavListModel); es gibt keine Buttons neu zu bauen."""
+        self._menu_dirty = False
+
+    def all_menu_buttons(self):
+        return set()
+
+    def set_filter(self, text):
+        """Filtert die Einträge; Eltern von Treffern bleiben sichtbar."""
+        self.list_model.set_filter(text)
+
+    def update_menu_visibility(self):
+        """Aktualisiert Top-Bar, Filter und Liste für den aktuellen Sidebar-Zustand."""
+        self.top_bar_layout.setDirection(QVBoxLayout.TopToBottom if not self.expanded else QHBoxLayout.LeftToRight)
+        self.filter_edit.setVisible(self.expanded)
+        if self.expanded:
+            self.close_context_menu()
+        self.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded if self.expanded else Qt.ScrollBarAlwaysOff)
+        self.list_model.set_collapsed(not self.expanded)
+        self.highlight_nav_button(self.main_window.current_view)
+
+    def highlight_nav_button(self, active_key, retint=False):
+        """Aktiven Eintrag setzen; es werden nur betroffene Zeilen neu gezeichnet."""
+        if active_key != self.list_model.active_key:
+            self.list_model.set_active_key(active_key)
+        if retint:
+            self.list_view.viewport().update()
+
+    def _on_clicked(self, index):
+        node = index.data(NodeRole)
+        if node is None:
+            return
+        if node.view_key is not None:
+            self.set_view(node.view_key)
+        elif not self.expanded and node.children:
+            self._show_context_for(index)
+
+    def _on_entered(self, index):
+        if self.expanded:
+            return
+        node = index.data(NodeRole)
+        if node is self._context_node and self.hover_tracker.is_open(self.context_menu):
+            return
+        self.close_context_menu()
+        if node is not None and node.children:
+            self._show_context_for(index)
+
+    def _show_context_for(self, index):
+        node = index.data(NodeRole)
+        row_rect = self.list_view.visualRect(index)
+        self.context_menu = self.show_context_menu(self.list_view.viewport(), node, row_rect)
+        self._context_node = node
+
+    def close_context_menu(self):
+        self.hover_tracker.close()
+        self.context_menu = None
+        self._context_node = None
+
+    def show_context_menu(self, button, submenu_node, anchor_rect=None):
+        """Kontextmenü neben der Zeile `anchor_rect` (Koordinaten von `button`) anzeigen."""
+        if self.expanded:
+            return None
+        menu = self.context_menu_for(submenu_node)
+        menu.set_active_key(self.main_window.current_view)
+        rect = anchor_rect if anchor_rect is not None else button.rect()
+        pos = button.mapToGlobal(rect.topLeft())
+        pos.setX(self.mapToGlobal(self.rect().topRight()).x() + 1)
+        menu.show_menu(pos)
+        self.hover_tracker.watch(menu, button, rect)
+        return menu
@@ -1,7 +1,35 @@
-from PySide6.QtGui import QPixmap, QPainter, QColor, QIcon
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QPixmap, QPainter, QColor, QIcon, QImage, QGuiApplication
+from PySide6.QtCore import Qt, QSize, QObject, QEvent
 from PySide6.QtWidgets import QLabel
 
+from lib.utils.icon_atlas import IconAtlas
+from lib.utils.icon_engine import LazyIconEngine
+from lib.utils.lru_cache import LRUCache
+from lib.utils.ui_batch import recolor, set_icon
+from lib.utils.widget_registry import WidgetRegistry
+
+ICON_CACHE_BUDGET = 8 * 1024 * 1024  # Bytes, ca. 2000 Icons in 32x32
+MASK_CACHE_BUDGET = 2 * 1024 * 1024  # Bytes für ungefärbte Basis-Masken
+
+
+def _icon_cost(icon):
+    """Speicherbedarf eines gecachten Icons (ARGB32, alle Modi).
+
+    Bei Icons mit LazyIconEngine zählen die bisher gerenderten Pixmaps.
+    """
+    variants = getattr(icon, "variants", None)
+    if variants is not None:
+        return sum(_pixmap_cost(pixmap) for pixmap in variants.values()) or 1
+    return sum(
+        size.width() * size.height() * 4
+        for mode in (QIcon.Normal, QIcon.Disabled, QIcon.Active, QIcon.Selected)
+        for size in icon.availableSizes(mode)
+    ) or 1
+
+
+def _pixmap_cost(pixmap):
+    return pixmap.width() * pixmap.height() * 4 or 1
+
 
 class IconUpdateCallback:
     def __init__(self, function, *args, **kwargs):
@@ -13,69 +41,250 @@ class IconUpdateCallback:
         return self.func(*self.args, **self.kwargs)
 
 
+class _ShowWatcher(QObject):
+    """Wendet zurückgestellte Icon-Updates an, sobald ein Widget sichtbar wird."""
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Show:
+            obj.removeEventFilter(self)
+            self.store.apply_pending(obj)
+        return False
+
+
 class IconStore:
     def __init__(self):
-        self.icon_widgets = []  # Liste von Widgets und ihren Icon-Namen
+        self.icon_widgets = WidgetRegistry()  # Schwache Registry: Widget -> Icon-Name, Größe, Dark-Variante
         self.icon_update_callbacks: [IconUpdateCallback] = []  # Liste von Callback-Funktionen, z.B. um Farben zu aktualisieren
+        self.icon_cache = LRUCache(ICON_CACHE_BUDGET, _icon_cost)  # (name, dark, size, dpr, color, selected) -> QIcon
+        self.mask_cache = LRUCache(MASK_CACHE_BUDGET, _pixmap_cost)  # (name, size, dpr) -> QPixmap
+        self._show_watcher = None
+        self.atlas = None  # vorgerenderte Masken, siehe lib/utils/icon_atlas.py
+        self._svg_renderers = {}  # Icon-Name -> QSvgRenderer, SVG nur einmal parsen
+        self._atlas_checked = False
 
-    def register(self, widget, icon_name):
+    def set_cache_budget(self, max_bytes):
+        """Speicherbudget des Icon-Caches setzen (LRU-Verdrängung)."""
+        self.icon_cache.set_max_cost(max_bytes)
+
+    def cache_stats(self):
+        """Treffer/Fehlschläge/Verdrängungen des Icon-Caches."""
+        return {**self.icon_cache.stats(), "masks": self.mask_cache.stats()}
+
+    def register(self, widget, icon_name, size=32, icon_name_dark=None):
         """Widget mit Icon im Store registrieren."""
-        if (widget, icon_name) not in self.icon_widgets:
-            self.icon_widgets.append((widget, icon_name))
+        return self.icon_widgets.add(widget, icon_name, size, icon_name_dark)
+
+    def registered_count(self):
+        """Anzahl der aktuell registrierten (lebenden) Widgets."""
+        return len(self.icon_widgets)
 
-    def update_icons(self, dark_mode):
-        """Alle Icons im Store aktualisieren."""
-        for widget, icon_name, size, icon_name_dark in self.icon_widgets:
-            if isinstance(widget, QLabel):
-                widget.setPixmap(self.load_iconify_icon(icon_name, dark_mode, size=size, icon_name_dark=icon_name_dark).pixmap(QSize(size, size)))
-            else:
-                widget.setIcon(self.load_iconify_icon(icon_name, dark_mode, size=size, icon_name_dark=icon_name_dark))
+    def update_icons(self, dark_mode, defer_hidden=True):
+        """Alle Icons im Store aktualisieren.
+
+        Widgets, deren Icon sich nicht ändert, werden übersprungen. Unsichtbare
+        Widgets werden erst beim nächsten Show-Event aktualisiert.
+        """
+        updated = skipped = deferred = 0
+        for widget, entry in self.icon_widgets:
+            key = self._icon_key(entry.icon_name, dark_mode, entry.size, entry.icon_name_dark)[0]
+            if entry.applied_key == key:
+                if entry.pending_dark_mode is not None:
+                    # Zurückgestelltes Update ist überholt, das gesetzte Icon passt wieder
+                    entry.pending_dark_mode = entry.pending_color = None
+                    widget.removeEventFilter(self._show_watcher)
+                skipped += 1
+                continue
+            if defer_hidden and not widget.isVisible():
+                self._defer(widget, entry, dark_mode)
+                deferred += 1
+                continue
+            self._apply_icon(widget, entry, dark_mode)
+            updated += 1
 
         """call callbacks after update_icons"""
         for callback in self.icon_update_callbacks:
             callback()
 
-    def load_iconify_icon(self, icon_name, dark_mode, widget=None, size=32, icon_name_dark=None):
-        """Lädt und färbt ein Icon basierend auf dem Modus."""
+        return {"updated": updated, "skipped": skipped, "deferred": deferred}
+
+    def preload(self, dark_mode):
+        """Icons aller registrierten Widgets für `dark_mode` in den Cache laden, ohne sie zu setzen.
+
+        Z.B. nach dem Start für das andere Theme, damit der erste Wechsel nichts rendern muss.
+        """
+        loaded = 0
+        for _, entry in self.icon_widgets:
+            key, load_icon_name, color = self._icon_key(entry.icon_name, dark_mode, entry.size, entry.icon_name_dark)
+            if key not in self.icon_cache:
+                self.icon_cache.get_or_create(key, lambda: self._build_icon(load_icon_name, entry.size, color, prerender=True, cache_key=key))
+                loaded += 1
+        return loaded
+
+    def ensure_atlas(self):
+        """Icon-Atlas laden bzw. neu bauen, falls er fehlt oder die SVGs sich geändert haben.
+
+        Läuft nach dem ersten Paint; bis dahin werden fehlende Masken aus den SVGs gerendert.
+        """
+        self.atlas = IconAtlas.load() or IconAtlas.build()
+        self._atlas_checked = True
+        return self.atlas
+
+    def apply_pending(self, widget):
+        """Zurückgestelltes Icon-Update für ein Widget ausführen."""
+        entry = self.icon_widgets.get(widget)
+        if entry is not None and entry.pending_dark_mode is not None:
+            self._apply_icon(widget, entry, entry.pending_dark_mode, entry.pending_color)
+
+    def _defer(self, widget, entry, dark_mode, color=None):
+        """Icon-Update bis zum nächsten Show-Event des Widgets zurückstellen."""
+        if entry.pending_dark_mode is None:
+            if self._show_watcher is None:
+                self._show_watcher = _ShowWatcher(self)
+            widget.installEventFilter(self._show_watcher)
+        entry.pending_dark_mode = dark_mode
+        entry.pending_color = color
+
+    def _apply_icon(self, widget, entry, dark_mode, color=None):
+        key, _, _ = self._icon_key(entry.icon_name, dark_mode, entry.size, entry.icon_name_dark, color)
+        entry.dark_mode = dark_mode
+        entry.pending_dark_mode = None
+        entry.pending_color = None
+        if entry.applied_key == key:
+            return  # Variante bereits gesetzt
+        icon = self.load_iconify_icon(entry.icon_name, dark_mode, size=entry.size, icon_name_dark=entry.icon_name_dark, color=color)
+        # Innerhalb von ui_batch() wird nur das zuletzt angeforderte Icon gesetzt
+        if isinstance(widget, QLabel):
+            size = entry.size
+            set_icon(widget, lambda: widget.setPixmap(icon.pixmap(QSize(size, size), widget.devicePixelRatioF())))
+        else:
+            set_icon(widget, lambda: widget.setIcon(icon))
+        entry.applied_key = key
+
+    @staticmethod
+    def _icon_key(icon_name, dark_mode, size, icon_name_dark=None, color=None, device_pixel_ratio=1.0, selected_color=None):
+        """Cache-Schlüssel, zu ladender Icon-Name und Farbe."""
         if icon_name_dark is None:
             icon_name_dark = icon_name
+        load_icon_name = icon_name_dark if dark_mode else icon_name
+        color = QColor(color if color is not None else ("white" if dark_mode else "black"))
+        selected_rgba = QColor(selected_color).rgba() if selected_color is not None else None
+        return (load_icon_name, bool(dark_mode), size, device_pixel_ratio, color.rgba(), selected_rgba), load_icon_name, color
+
+    def load_iconify_icon(self, icon_name, dark_mode, widget=None, size=32, icon_name_dark=None, color=None, device_pixel_ratio=1.0, selected_color=None):
+        """Lädt und färbt ein Icon basierend auf dem Modus.
 
+        Mit `selected_color` erhält das Icon zusätzlich eine Pixmap für den
+        Modus QIcon.Selected, sodass Views beim Hervorheben nur den Modus wechseln.
+        """
         """if icon has dark mode version, load it"""
-        load_icon_name = icon_name_dark if dark_mode and icon_name_dark is not None else icon_name
-        icon_path = f"assets/icons/{load_icon_name}.svg"
-        pixmap = QPixmap(icon_path)
-        pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        key, load_icon_name, color = self._icon_key(icon_name, dark_mode, size, icon_name_dark, color, device_pixel_ratio, selected_color)
+        icon = self.icon_cache.get_or_create(key, lambda: self._build_icon(load_icon_name, size, color, device_pixel_ratio, selected_color, cache_key=key))
 
-        """color it"""
-        color = QColor("white" if dark_mode else "black")
-        painter = QPainter(pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(pixmap.rect(), color)
-        painter.end()
+        # Wenn ein Widget übergeben wurde, in der Registry eintragen (bzw. aktualisieren)
+        if widget is not None:
+            entry = self.register(widget, icon_name, size, icon_name_dark)
+            entry.applied_key = key
+            entry.dark_mode = dark_mode
+
+        return icon
+
+    def _build_icon(self, icon_name, size, color, device_pixel_ratio=1.0, selected_color=None, prerender=False, cache_key=None):
+        """QIcon mit LazyIconEngine erzeugen (nur bei Cache-Miss).
 
-        # Wenn ein Widget übergeben wurde, füge es zur globalen Liste hinzu
-        if widget and widget not in self.icon_widgets:
-            self.icon_widgets.append((widget, icon_name, size, icon_name_dark))  # Speichere Widget und Icon-Name
+        Pixmaps entstehen erst beim Zeichnen, direkt in der Größe und dem
+        devicePixelRatio des Ziels, und werden dem Eintrag `cache_key` im
+        Icon-Cache angerechnet. Mit `prerender` (für `preload()`) wird die
+        Normal-Pixmap für den Bildschirm vorab erzeugt.
+        """
+        selected = QColor(selected_color) if selected_color is not None else color
 
-        return QIcon(pixmap)
+        def render(extent, dpr, mode):
+            tint = selected if mode == QIcon.Selected else color
+            if mode == QIcon.Disabled:
+                tint = QColor(tint)
+                tint.setAlphaF(tint.alphaF() * 0.4)
+            return self._tint(self._mask(icon_name, extent, dpr), tint)
+
+        on_render = (lambda: self.icon_cache.update_cost(cache_key)) if cache_key is not None else None
+        engine = LazyIconEngine(render, size, on_render=on_render)
+        icon = QIcon(engine)
+        icon.variants = engine.cache  # für _icon_cost
+        if prerender:
+            screen = QGuiApplication.primaryScreen()
+            icon.pixmap(QSize(size, size), screen.devicePixelRatio() if screen is not None else device_pixel_ratio)
+        return icon
+
+    def _mask(self, icon_name, size, device_pixel_ratio=1.0):
+        """Ungefärbte, skalierte Basis-Pixmap eines SVG-Icons."""
+        return self.mask_cache.get_or_create((icon_name, size, device_pixel_ratio), lambda: self._render_mask(icon_name, size, device_pixel_ratio))
+
+    def _render_mask(self, icon_name, size, device_pixel_ratio=1.0):
+        """Maske aus dem Atlas holen, sonst das SVG direkt in Zielauflösung rendern."""
+        if not self._atlas_checked:
+            self.atlas = IconAtlas.load()  # nur mmap und Index, baut nichts
+            self._atlas_checked = True
+        if self.atlas is not None:
+            pixmap = self.atlas.pixmap(icon_name, size, device_pixel_ratio)
+            if pixmap is not None:
+                return pixmap
+
+        # Direkt in Zielauflösung rendern statt Standardgröße + Skalieren (scharf auf HiDPI)
+        renderer = self._svg_renderers.get(icon_name)
+        if renderer is None:
+            from PySide6.QtSvg import QSvgRenderer  # nur ohne Atlas-Treffer nötig
+            renderer = self._svg_renderers[icon_name] = QSvgRenderer(f"assets/icons/{icon_name}.svg")
+            renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+        pixel_size = round(size * device_pixel_ratio)
+        image = QImage(pixel_size, pixel_size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        renderer.render(painter)
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
 
     @staticmethod
-    def update_icon_color_from_func(widget, func):
-        """Aktualisiert die Farbe des Icons eines Widgets basierend auf der angegebenen Farbe."""
-        color = func()
-        if isinstance(widget, QLabel):
-            pixmap = widget.pixmap()
-        else:
-            pixmap = widget.icon().pixmap(widget.iconSize())
+    def _tint(mask, color):
+        """Kopie der Maske in `color` einfärben; die Maske bleibt unverändert."""
+        pixmap = QPixmap(mask)
         painter = QPainter(pixmap)
         painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
         painter.fillRect(pixmap.rect(), color)
         painter.end()
+        return pixmap
+
+    def update_icon_color_from_func(self, widget, func):
+        """Aktualisiert die Farbe des Icons eines Widgets basierend auf der angegebenen Farbe.
+
+        Registrierte Widgets erhalten eine gecachte Farbvariante ihrer Maske;
+        ist die Variante bereits gesetzt, passiert nichts. Innerhalb von
+        ui_batch() läuft das Einfärben einmal pro Widget, nach dem Repolish.
+        """
+        recolor(widget, lambda: self._recolor(widget, func()))
+
+    def _recolor(self, widget, color):
+        entry = self.icon_widgets.get(widget)
+        if entry is not None and entry.dark_mode is not None:
+            # Ein zurückgestelltes Theme-Update hat Vorrang vor dem zuletzt gesetzten Theme
+            dark_mode = entry.pending_dark_mode if entry.pending_dark_mode is not None else entry.dark_mode
+            if widget.isVisible():
+                self._apply_icon(widget, entry, dark_mode, color)
+            elif entry.pending_dark_mode is not None or entry.applied_key != self._icon_key(entry.icon_name, dark_mode, entry.size, entry.icon_name_dark, color)[0]:
+                self._defer(widget, entry, dark_mode, color)  # unsichtbar: erst beim Show-Event einfärben
+            return
 
+        # Nicht registriertes Widget: aktuelle Pixmap direkt einfärben
         if isinstance(widget, QLabel):
-            widget.setPixmap(pixmap)
+            pixmap = self._tint(widget.pixmap(), color)
+            set_icon(widget, lambda: widget.setPixmap(pixmap))
         else:
-            widget.setIcon(QIcon(pixmap))
+            pixmap = self._tint(widget.icon().pixmap(widget.iconSize(), widget.devicePixelRatioF()), color)
+            set_icon(widget, lambda: widget.setIcon(QIcon(pixmap)))
 
 
 # Singleton-Instanz
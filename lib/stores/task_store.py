@@ -0,0 +1,218 @@
+import threading
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+MAX_QUEUED_TASKS = 64  # tasks waiting for a thread; submit() refuses more
+LATENCY_SAMPLES = 200
+
+
+class TaskQueueFull(RuntimeError):
+    """Raised by `submit()` when the queue is at its limit."""
+
+
+class TaskCancelled(Exception):
+    """Raised by `Task.check_cancelled()` inside a task that was cancelled."""
+
+
+class Task(QObject):
+    """Handle of a submitted task; its signals are delivered on the GUI thread.
+
+    The task function receives the handle as first argument and may call
+    `report_progress()` and `check_cancelled()` from the worker thread.
+    """
+    progress = Signal(object)
+    result = Signal(object)
+    error = Signal(str)
+    cancelled = Signal()
+    finished = Signal()  # after result, error or cancelled
+
+    _completed = Signal(str, object)  # worker -> GUI thread
+
+    def __init__(self, store, fn, args, kwargs, owner, name):
+        super().__init__()
+        self.store = store
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.owner = owner
+        self.name = name or getattr(fn, "__name__", "task")
+        self.state = "queued"  # queued, running, done, failed, cancelled
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+        self._runnable = None
+        self._completed.connect(self._on_completed)
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise TaskCancelled(self.name)
+
+    def report_progress(self, value):
+        if not self._cancel_event.is_set():
+            self.progress.emit(value)
+
+    def cancel(self):
+        """Cancel the task; a queued task is dropped, a running one stops at its next check."""
+        if self.state in ("done", "failed", "cancelled") or self._cancel_event.is_set():
+            return
+        self._cancel_event.set()
+        if self.state == "queued" and self.store.pool.tryTake(self._runnable):
+            self._on_completed("cancelled", None)
+
+    def queue_ms(self):
+        return ((self.started_at or time.perf_counter()) - self.submitted_at) * 1000
+
+    def run_ms(self):
+        return ((self.finished_at or time.perf_counter()) - self.started_at) * 1000 if self.started_at else 0.0
+
+    def _run(self):
+        # Worker thread
+        self.started_at = time.perf_counter()
+        self.state = "running"
+        try:
+            if self._cancel_event.is_set():
+                raise TaskCancelled(self.name)
+            value = self.fn(self, *self.args, **self.kwargs)
+        except TaskCancelled:
+            self._completed.emit("cancelled", None)
+        except Exception as exc:
+            self._completed.emit("failed", f"{type(exc).__name__}: {exc}")
+        else:
+            self._completed.emit("cancelled" if self._cancel_event.is_set() else "done", value)
+
+    def _on_completed(self, state, payload):
+        # GUI thread
+        self.finished_at = time.perf_counter()
+        self.state = state
+        self.store._task_completed(self)
+        if state == "done":
+            self.result.emit(payload)
+        elif state == "failed":
+            self.error.emit(payload)
+        else:
+            self.cancelled.emit()
+        self.finished.emit()
+
+
+class _TaskRunnable(QRunnable):
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+        self.setAutoDelete(False)
+
+    def run(self):
+        self.task._run()
+
+
+class TaskStore:
+    """Shared worker pool for views.
+
+    Tasks belong to an optional owner (usually a view). They are cancelled
+    when the owner is destroyed, e.g. evicted by the ViewManager, or when the
+    view calls `cancel_owner(self)` from `on_suspend`.
+    """
+
+    def __init__(self, max_threads=None, max_queued=MAX_QUEUED_TASKS):
+        self.pool = QThreadPool()
+        if max_threads:
+            self.pool.setMaxThreadCount(max_threads)
+        self.max_queued = max_queued
+        self.tasks = set()  # submitted, not yet finished
+        self._owners = {}  # id(owner) -> set of tasks
+        self.submitted = 0
+        self.completed = {"done": 0, "failed": 0, "cancelled": 0}
+        self.rejected = 0
+        self.queue_latency = deque(maxlen=LATENCY_SAMPLES)  # ms from submit to start
+        self.run_latency = deque(maxlen=LATENCY_SAMPLES)  # ms from start to finish
+
+    def submit(self, fn, *args, owner=None, name=None, priority=0, **kwargs):
+        """Run `fn(task, *args, **kwargs)` on the pool and return its `Task`."""
+        if self.queue_length() >= self.max_queued:
+            self.rejected += 1
+            raise TaskQueueFull(f"{self.queue_length()} tasks queued")
+        task = Task(self, fn, args, kwargs, owner, name)
+        task._runnable = _TaskRunnable(task)
+        self.tasks.add(task)
+        if owner is not None:
+            owned = self._owners.get(id(owner))
+            if owned is None:
+                owned = self._owners[id(owner)] = set()
+                owner.destroyed.connect(lambda *_, key=id(owner): self._cancel_key(key, forget=True))
+            owned.add(task)
+        self.submitted += 1
+        self.pool.start(task._runnable, priority)
+        return task
+
+    def cancel_owner(self, owner):
+        """Cancel all unfinished tasks of `owner`."""
+        return self._cancel_key(id(owner))
+
+    def cancel_all(self):
+        for task in list(self.tasks):
+            task.cancel()
+
+    def queue_length(self):
+        return sum(1 for task in self.tasks if task.state == "queued")
+
+    def running(self):
+        return sum(1 for task in self.tasks if task.state == "running")
+
+    def wait(self, timeout_ms=-1):
+        """Block until the pool is idle (for shutdown and scripts)."""
+        return self.pool.waitForDone(timeout_ms)
+
+    def shutdown(self, timeout_ms=2000):
+        """Cancel all tasks and wait up to `timeout_ms` for running ones, e.g. on aboutToQuit."""
+        self.cancel_all()
+        return self.wait(timeout_ms)
+
+    def stats(self):
+        return {
+            "queued": self.queue_length(),
+            "running": self.running(),
+            "max_threads": self.pool.maxThreadCount(),
+            "max_queued": self.max_queued,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            **self.completed,
+            "queue_ms": _summary(self.queue_latency),
+            "run_ms": _summary(self.run_latency),
+        }
+
+    def _cancel_key(self, key, forget=False):
+        owned = self._owners.pop(key, ()) if forget else self._owners.get(key, ())
+        for task in list(owned):
+            task.cancel()
+        return len(owned)
+
+    def _task_completed(self, task):
+        self.tasks.discard(task)
+        if task.owner is not None:
+            owned = self._owners.get(id(task.owner))
+            if owned is not None:
+                owned.discard(task)
+        task.owner = None
+        self.completed[task.state] += 1
+        if task.started_at is not None:
+            self.queue_latency.append(task.queue_ms())
+            self.run_latency.append(task.run_ms())
+
+
+def _summary(samples):
+    if not samples:
+        return {"avg": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    return {
+        "avg": sum(ordered) / len(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+
+task_store = TaskStore()
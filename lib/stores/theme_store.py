@@ -1,10 +1,17 @@
 import platform
+import threading
+import time
 
-from PySide6.QtCore import QFile, QIODevice, QTextStream
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
 
 from lib.stores.icon_store import icon_store
+from lib.utils.stylesheet import StylesheetCompiler
+from lib.utils import ui_batch as batching
+
+STYLE_TEMPLATE = "assets/styles/style.qss"
+STYLE_THEMES = "assets/styles/themes.json"
+SHADOW_MODES = ("strip", "effect")  # cached seam strip, or QGraphicsDropShadowEffect on the content area
 
 
 def detect_system_theme() -> bool:
@@ -47,58 +54,148 @@ class ThemeStore:
     def __init__(self):
         self.app = None
         self.window = None
-        self.dark_mode = detect_system_theme()
+        self._dark_mode = None  # detected on first use, not at import time
+        self._theme = None
+        self._detector = None
+        self.applied_qss = None
+        self.stylesheets = StylesheetCompiler(STYLE_TEMPLATE, STYLE_THEMES)
+        self.shadow_mode = "strip"
+        self.toggle_stats = []  # timing breakdown per toggle, newest last
+        self.max_toggle_stats = 50
+
+    @property
+    def dark_mode(self):
+        if self._dark_mode is None:
+            if self._detector is not None:
+                self._detector.join()
+            if self._dark_mode is None:
+                self._dark_mode = detect_system_theme()
+        return self._dark_mode
+
+    @dark_mode.setter
+    def dark_mode(self, value):
+        self._dark_mode = value
+
+    @property
+    def theme(self):
+        return self._theme or ("dark" if self.dark_mode else "light")
+
+    @theme.setter
+    def theme(self, value):
+        self._theme = value
+
+    def detect_in_background(self):
+        """Start the OS theme detection on a thread; `dark_mode` waits for it on first access."""
+        def detect():
+            self._dark_mode = detect_system_theme()
+        if self._dark_mode is None and self._detector is None:
+            self._detector = threading.Thread(target=detect, name="theme-detection", daemon=True)
+            self._detector.start()
+
+    def wait_for_detection(self):
+        """Block until the background detection has finished and return `dark_mode`."""
+        return self.dark_mode
 
     def toggle_theme(self):
         """Toggle between light and dark themes."""
-        if theme_store.dark_mode:
-            self.apply_light_theme(theme_store.window)
-        else:
-            self.apply_dark_theme(theme_store.window)
+        start = time.perf_counter()
+        coalesced = batching.stats()["coalesced"]
+        # Icon and recolor requests from the callbacks are applied once, after the stylesheet
+        with batching.ui_batch():
+            if theme_store.dark_mode:
+                self.apply_light_theme(theme_store.window)
+            else:
+                self.apply_dark_theme(theme_store.window)
+            styled = time.perf_counter()
+
+            icons = icon_store.update_icons(theme_store.dark_mode)
+        end = time.perf_counter()
+
+        stats = {
+            "dark_mode": theme_store.dark_mode,
+            "stylesheet_ms": (styled - start) * 1000,
+            "icons_ms": (end - styled) * 1000,
+            "total_ms": (end - start) * 1000,
+            **icons,
+            "coalesced": batching.stats()["coalesced"] - coalesced,
+        }
+        self.toggle_stats.append(stats)
+        del self.toggle_stats[:-self.max_toggle_stats]
+        return stats
+
+    @property
+    def last_toggle_ms(self):
+        """Duration of the most recent toggle in milliseconds."""
+        return self.toggle_stats[-1]["total_ms"] if self.toggle_stats else None
+
+    def set_stylesheet(self, qss):
+        """Apply a stylesheet to the app, skipping the repolish if nothing changed."""
+        if qss == self.applied_qss:
+            return False
+        self.app.setStyleSheet(qss)
+        self.applied_qss = qss
+        return True
+
+    def get_qss(self, theme):
+        """Compiled QSS for the given theme, e.g. "light" or "dark"."""
+        return self.stylesheets.compile(theme)
+
+    def enable_stylesheet_cache(self, cache_dir):
+        """Keep compiled stylesheets on disk, keyed by the source file mtimes."""
+        self.stylesheets.cache_dir = cache_dir
+
+    def apply_theme(self, window, theme):
+        """Apply a theme from the themes file by name."""
+        spec = self.stylesheets.theme(theme)
+        theme_store.theme = theme
+        theme_store.dark_mode = spec["dark_mode"]
+        self.set_stylesheet(self.get_qss(theme))
+
+        self.apply_shadow(spec["shadow"])
+
+    def apply_shadow(self, shadow_spec):
+        """Seam shadow between sidebar and content in the current `shadow_mode`."""
+        color = QColor(*shadow_spec["color"])
+        seam_shadow = getattr(self.window, "seam_shadow", None)
+        if self.shadow_mode == "strip" and seam_shadow is not None:
+            self.window.content_area.setGraphicsEffect(None)
+            seam_shadow.set_shadow(color, shadow_spec["blur_radius"])
+            seam_shadow.show()
+            return
+
+        # Create shadow effect; renders the whole content area offscreen on every repaint
+        if seam_shadow is not None:
+            seam_shadow.hide()
+        # Parented, otherwise PySide drops the effect once `shadow` goes out of scope
+        shadow = QGraphicsDropShadowEffect(self.window.content_area)
+        shadow.setBlurRadius(shadow_spec["blur_radius"])
+        shadow.setColor(color)
+        shadow.setOffset(5, 0)  # Shadow to the right
+        self.window.content_area.setGraphicsEffect(shadow)
 
-        icon_store.update_icons(theme_store.dark_mode)
+    def set_shadow_mode(self, mode):
+        """Switch between "strip" and "effect" and re-apply the shadow of the current theme."""
+        if mode not in SHADOW_MODES:
+            raise ValueError(f"Unknown shadow mode: {mode}")
+        self.shadow_mode = mode
+        if self.window is not None:
+            self.apply_shadow(self.stylesheets.theme(self.theme)["shadow"])
 
     def apply_light_theme(self, window):
         """Apply the light theme."""
-        theme_store.dark_mode = False
-        self.app.setStyleSheet(self.get_light_qss())
-
-        # Create shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(13)
-        shadow.setColor(QColor(0, 0, 0, 150))  # Semi-transparent black
-        shadow.setOffset(5, 0)  # Shadow to the right
-        self.window.content_area.setGraphicsEffect(shadow)
+        self.apply_theme(window, "light")
 
     def apply_dark_theme(self, window):
         """Apply the dark theme."""
-        theme_store.dark_mode = True
-        self.app.setStyleSheet(self.get_dark_qss())
+        self.apply_theme(window, "dark")
 
-        # Create shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(14)
-        shadow.setColor(QColor(255, 255, 255, 150))  # Semi-transparent black
-        shadow.setOffset(5, 0)  # Shadow to the right
-        self.window.content_area.setGraphicsEffect(shadow)
-
-    @staticmethod
-    def get_light_qss():
+    def get_light_qss(self):
         """QSS for light mode."""
+        return self.get_qss("light")
 
-        file = QFile("assets/styles/style--light.css")
-        file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text)
-        stream = QTextStream(file)
-        return stream.readAll()
-
-    @staticmethod
-    def get_dark_qss():
+    def get_dark_qss(self):
         """QSS for dark mode."""
-
-        file = QFile("assets/styles/style--dark.css")
-        file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text)
-        stream = QTextStream(file)
-        return stream.readAll()
+        return self.get_qss("dark")
 
 
 # Singleton-Instanz
@@ -0,0 +1,44 @@
+import time
+
+from PySide6.QtGui import QGuiApplication
+
+
+def frame_budget_ms():
+    """Frame budget of the primary screen in milliseconds (60 Hz fallback)."""
+    screen = QGuiApplication.primaryScreen()
+    rate = screen.refreshRate() if screen is not None else 0
+    return 1000.0 / (rate if rate and rate > 1 else 60.0)
+
+
+class FrameTimer:
+    """Records frame timestamps, e.g. from QVariantAnimation.valueChanged, and reports dropped frames."""
+
+    def __init__(self, budget_ms=None):
+        self.budget_ms = budget_ms
+        self._start = None
+        self._frames = []
+
+    def start(self):
+        self._start = time.perf_counter()
+        self._frames = []
+        if self.budget_ms is None:
+            self.budget_ms = frame_budget_ms()
+
+    def frame(self, *_):
+        self._frames.append(time.perf_counter())
+
+    def stop(self, **extra):
+        """Frame statistics since `start()`."""
+        end = time.perf_counter()
+        stamps = [self._start] + self._frames
+        intervals = [(b - a) * 1000 for a, b in zip(stamps, stamps[1:])]
+        dropped = sum(max(0, round(interval / self.budget_ms) - 1) for interval in intervals)
+        return {
+            "frames": len(self._frames),
+            "duration_ms": (end - self._start) * 1000,
+            "avg_frame_ms": sum(intervals) / len(intervals) if intervals else 0.0,
+            "max_frame_ms": max(intervals, default=0.0),
+            "budget_ms": self.budget_ms,
+            "dropped_frames": dropped,
+            **extra,
+        }
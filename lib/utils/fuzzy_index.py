@@ -0,0 +1,327 @@
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import insort
+from collections import Counter
+
+from lib.stores.task_store import task_store
+
+MAX_RESULTS = 20
+ASYNC_REBUILD_MIN = 2000  # menus with more entries are indexed on a worker thread
+FUZZY_MIN_RATIO = 0.5  # share of query trigrams a typo match must contain
+TYPO_BUDGET = 4000  # posting entries counted for typo matching, rarest trigrams first
+PREFIX_LEN = 3  # word prefixes up to this length have presorted entry lists
+
+_WORD_SPLIT = re.compile(r"[^0-9a-z]+")
+
+
+def fold(text):
+    """Lower case without accents, so "Übersicht" is found by "ubersicht"."""
+    text = text.casefold()
+    if text.isascii():
+        return text
+    return "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class Match:
+    """A search result: the entry and its score (higher is better)."""
+    __slots__ = ("view_key", "title", "icon", "path", "score")
+
+    def __init__(self, entry, score):
+        self.view_key, self.title, self.icon, self.path = entry.view_key, entry.title, entry.icon, entry.path
+        self.score = score
+
+    def __repr__(self):
+        return f"Match({self.view_key!r}, {self.score:.1f})"
+
+
+class _Entry:
+    __slots__ = ("id", "view_key", "title", "icon", "path", "folded_title", "haystack", "word_starts", "grams", "prefixes", "rank")
+
+    def __init__(self, entry_id, view_key, title, icon, path):
+        self.id = entry_id
+        self.view_key = view_key
+        self.title = title
+        self.icon = icon
+        self.path = path
+        self.folded_title = fold(title)
+        folded_key = fold(view_key)
+        self.haystack = f"{self.folded_title} {folded_key} {fold(path)}"
+        words = [word for word in _WORD_SPLIT.split(f"{self.folded_title} {folded_key}") if word]
+        self.word_starts = " " + " ".join(words)  # " word" occurs for every word prefix
+        self.grams = trigrams(self.haystack)
+        self.prefixes = {word[:n] for word in words for n in range(1, PREFIX_LEN + 1)}
+        self.rank = (len(title), self.folded_title, entry_id)  # tie break: short titles first
+
+
+class _Snapshot:
+    """Posting lists of one index generation; guarded by `lock` against worker searches."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}  # id -> _Entry
+        self.by_key = {}  # view_key -> id
+        self.grams = {}  # trigram -> set of ids
+        self.prefixes = {}  # word prefix -> [(title misses prefix?, rank)], sorted
+        self.next_id = 0
+
+    def add(self, view_key, title, icon, path, presorted=True):
+        if view_key in self.by_key:
+            self.remove(view_key)
+        entry = _Entry(self.next_id, view_key, title, icon, path)
+        self.next_id += 1
+        self.entries[entry.id] = entry
+        self.by_key[view_key] = entry.id
+        for gram in entry.grams:
+            self.grams.setdefault(gram, set()).add(entry.id)
+        for prefix in entry.prefixes:
+            ranked = self.prefixes.setdefault(prefix, [])
+            if presorted:
+                insort(ranked, self._prefix_key(entry, prefix))
+            else:
+                ranked.append(self._prefix_key(entry, prefix))
+
+    def sort_prefixes(self):
+        """Sort the prefix lists after adding with `presorted=False` (bulk builds)."""
+        for ranked in self.prefixes.values():
+            ranked.sort()
+
+    def remove(self, view_key):
+        entry = self.entries.pop(self.by_key.pop(view_key, None), None)
+        if entry is None:
+            return
+        for gram in entry.grams:
+            posting = self.grams[gram]
+            posting.discard(entry.id)
+            if not posting:
+                del self.grams[gram]
+        for prefix in entry.prefixes:
+            ranked = self.prefixes[prefix]
+            ranked.remove(self._prefix_key(entry, prefix))
+            if not ranked:
+                del self.prefixes[prefix]
+
+    @staticmethod
+    def _prefix_key(entry, prefix):
+        return (not entry.folded_title.startswith(prefix), entry.rank)
+
+    def search(self, query, limit):
+        words = [word for word in fold(query).split() if word]
+        if not words:
+            return []
+        with self.lock:
+            grams = set()
+            for word in words:
+                if len(word) >= 3:
+                    grams |= trigrams(word)
+            # Entries containing every query trigram; None for one or two character queries
+            candidates = None
+            if grams:
+                postings = sorted((self.grams.get(gram, ()) for gram in grams), key=len)
+                candidates = set(postings[0]).intersection(*postings[1:])
+            results = self._search_prefixes(words, limit, candidates)
+            if len(results) < limit and grams:
+                results += self._search_grams(words, grams, candidates, limit - len(results), results)
+            return [Match(entry, score) for score, entry in results]
+
+    def _search_prefixes(self, words, limit, candidates):
+        """Entries where every query word starts a word of the title or view key.
+
+        The prefix lists are sorted by (title misses the prefix, rank), so the
+        walk stops as soon as the best `limit` entries are certain; a small
+        candidate set is checked directly instead.
+        """
+        query = " ".join(words)
+        starts = [" " + word for word in words]
+        ranked = self.prefixes.get(words[0][:PREFIX_LEN], ())
+        if candidates is not None and len(candidates) < len(ranked) // 4:
+            ranked = sorted(self._prefix_key(self.entries[entry_id], words[0][:PREFIX_LEN]) for entry_id in candidates)
+        top, rest = [], []  # title starts with the query / word starts only
+        later = 0  # entries in `rest` whose title misses the first prefix
+        for title_miss, rank in ranked:
+            entry = self.entries[rank[-1]]
+            if not all(start in entry.word_starts for start in starts):
+                continue
+            if not title_miss and entry.folded_title.startswith(query):
+                top.append(entry)
+                if len(top) >= limit:
+                    break
+            else:
+                rest.append(entry)
+                later += title_miss
+                if later >= limit - len(top):
+                    break
+        rest.sort(key=lambda entry: entry.rank)
+        return ([(_score(100.0, entry), entry) for entry in top]
+                + [(_score(80.0, entry), entry) for entry in rest[:limit - len(top)]])
+
+    def _search_grams(self, words, grams, candidates, limit, found):
+        """Substring matches anywhere (also in the parent path), then typo tolerant matches."""
+        exclude = {entry.id for _, entry in found}
+        # Trigram hits are only candidates, the words must really occur
+        exact = [entry for entry in map(self.entries.__getitem__, candidates - exclude)
+                 if all(word in entry.haystack for word in words)]
+        results = heapq.nlargest(limit, [
+            (_score(60.0 if all(word in entry.folded_title for word in words) else 50.0, entry), -entry.id, entry)
+            for entry in exact
+        ])
+        results = [(score, entry) for score, _, entry in results]
+        if len(results) < limit and len(grams) >= 3:
+            exclude.update(entry.id for entry in exact)
+            results += self._search_typos(grams, exclude, limit - len(results))
+        return results
+
+    def _search_typos(self, grams, exclude, limit):
+        """Entries sharing most query trigrams, for queries with a typo."""
+        hits = Counter()
+        counted = budget = 0
+        for posting in sorted((self.grams.get(gram, ()) for gram in grams), key=len):
+            budget += len(posting)
+            if budget > TYPO_BUDGET and counted:
+                break
+            hits.update(posting)
+            counted += 1
+        needed = max(2, int(counted * FUZZY_MIN_RATIO + 0.5))
+        scored = ((40.0 * count / counted, self.entries[entry_id])
+                  for entry_id, count in hits.items() if count >= needed and entry_id not in exclude)
+        return heapq.nlargest(limit, scored, key=lambda pair: (pair[0], -pair[1].rank[0]))
+
+
+def _score(base, entry):
+    return base - min(len(entry.folded_title), 50) * 0.1
+
+
+def _build(task, items):
+    # Worker thread
+    snapshot = _Snapshot()
+    for index, item in enumerate(items):
+        snapshot.add(*item, presorted=False)
+        if index % 500 == 0 and task is not None:
+            task.check_cancelled()
+    snapshot.sort_prefixes()
+    return snapshot
+
+
+def _search_when_built(task, index, query, limit):
+    # Worker thread: wait for the rebuild, then search the new snapshot
+    while not index._built.wait(0.05):
+        task.check_cancelled()
+    return index._snapshot.search(query, limit)
+
+
+class FuzzyIndex:
+    """Trigram and word prefix index over the titles and view keys of a MenuModel.
+
+    `attach()` indexes a model and follows its add/remove events; large models
+    are indexed on a worker thread, and `search_async()` runs the matching on
+    the worker too until the new index is ready.
+    """
+
+    def __init__(self, limit=MAX_RESULTS):
+        self.limit = limit
+        self.menu_model = None
+        self.rebuild_task = None
+        self._snapshot = _Snapshot()
+        self._built = threading.Event()
+        self._built.set()
+        self._pending = []  # model events while a rebuild runs
+
+    def __len__(self):
+        return len(self._snapshot.entries)
+
+    @property
+    def rebuilding(self):
+        return self.rebuild_task is not None
+
+    def attach(self, menu_model):
+        """Index `menu_model` and keep the index current on its changes."""
+        if self.menu_model is not None:
+            self.menu_model.listeners.remove(self._on_menu_changed)
+        self.menu_model = menu_model
+        menu_model.listeners.append(self._on_menu_changed)
+        self.rebuild(background=len(menu_model) >= ASYNC_REBUILD_MIN)
+
+    def detach(self):
+        if self.menu_model is not None:
+            self.menu_model.listeners.remove(self._on_menu_changed)
+            self.menu_model = None
+        if self.rebuild_task is not None:
+            task, self.rebuild_task = self.rebuild_task, None
+            task.cancel()
+            self._built.set()
+
+    def rebuild(self, background=False):
+        """Reindex the whole model, on a worker thread if `background`."""
+        items = [self._item(node) for node in self.menu_model if node.view_key is not None]
+        if self.rebuild_task is not None:
+            task, self.rebuild_task = self.rebuild_task, None
+            task.cancel()
+        self._pending.clear()
+        if not background:
+            self._snapshot = _build(None, items)
+            self._built.set()
+            return None
+        self._built.clear()
+        task = self.rebuild_task = task_store.submit(_build, items, name="fuzzy-index")
+        task.result.connect(lambda snapshot, task=task: self._on_built(task, snapshot))
+        task.error.connect(lambda message, task=task: self._on_build_failed(task))
+        task.cancelled.connect(lambda task=task: self._on_build_failed(task))
+        return task
+
+    def search(self, query, limit=None):
+        """Ranked matches for `query`; on the GUI thread only when not rebuilding."""
+        return self._snapshot.search(query, limit or self.limit)
+
+    def search_async(self, query, callback, limit=None, owner=None):
+        """Call `callback(matches)`: right away, or from a worker task while rebuilding."""
+        if not self.rebuilding:
+            callback(self.search(query, limit))
+            return None
+        task = task_store.submit(_search_when_built, self, query, limit or self.limit, owner=owner, name="fuzzy-search")
+        task.result.connect(callback)
+        return task
+
+    def _on_built(self, task, snapshot):
+        if task is not self.rebuild_task:
+            return  # superseded by a newer rebuild
+        with snapshot.lock:
+            for event, item in self._pending:
+                if event == "add":
+                    snapshot.add(*item)
+                else:
+                    snapshot.remove(item)
+        self._pending.clear()
+        self._snapshot = snapshot
+        self.rebuild_task = None
+        self._built.set()
+
+    def _on_build_failed(self, task):
+        if task is not self.rebuild_task:
+            return  # superseded by a newer rebuild or detached
+        # Failed or cancelled from outside: index synchronously so waiting searches finish
+        self.rebuild_task = None
+        self._built.set()
+        self.rebuild(background=False)
+
+    def _on_menu_changed(self, event, node):
+        if node.view_key is None:
+            return
+        change = (event, self._item(node) if event == "add" else node.view_key)
+        if self.rebuilding:
+            self._pending.append(change)
+            return
+        with self._snapshot.lock:
+            if event == "add":
+                self._snapshot.add(*change[1])
+            else:
+                self._snapshot.remove(node.view_key)
+
+    @staticmethod
+    def _item(node):
+        path = " › ".join(ancestor.title for ancestor in node.ancestors)
+        return node.view_key, node.title, node.icon, path
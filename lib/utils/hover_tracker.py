@@ -0,0 +1,92 @@
+from PySide6.QtCore import QEvent, QObject, QRect, QTimer, Signal
+from PySide6.QtGui import QCursor
+
+# Events the tracker reacts to; everything else returns immediately
+_HOVER_EVENTS = frozenset((QEvent.Enter, QEvent.Leave, QEvent.HoverEnter, QEvent.HoverLeave, QEvent.MouseMove))
+_GEOMETRY_EVENTS = frozenset((QEvent.Move, QEvent.Resize, QEvent.Show))
+
+
+class HoverTracker(QObject):
+    """Keeps a popup open while the cursor is over its anchor or the popup itself.
+
+    Only enter/leave/mouse-move events start or stop a short grace timer; the
+    cursor position is checked once when the timer fires, against global
+    rectangles that are cached until the anchor or popup moves or resizes.
+    """
+    closed = Signal(QObject)
+
+    def __init__(self, grace_ms=120, parent=None):
+        super().__init__(parent)
+        self.popup = None
+        self.anchor = None
+        self.anchor_rect = None  # part of the anchor that counts, e.g. a list row
+        self._rects = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(grace_ms)
+        self._timer.timeout.connect(self._check)
+
+    def watch(self, popup, anchor, anchor_rect=None):
+        """Track `popup` opened from `anchor`; a previously tracked popup is closed."""
+        if popup is not self.popup:
+            self.close()
+        elif anchor is not self.anchor and self.anchor is not None:
+            self.anchor.removeEventFilter(self)
+        self.popup = popup
+        self.anchor = anchor
+        self.anchor_rect = anchor_rect
+        self._rects = None
+        self._timer.stop()
+        popup.installEventFilter(self)
+        anchor.installEventFilter(self)
+
+    def close(self):
+        """Close the tracked popup immediately."""
+        self._timer.stop()
+        popup, anchor = self.popup, self.anchor
+        self.popup = self.anchor = self.anchor_rect = None
+        self._rects = None
+        if anchor is not None:
+            anchor.removeEventFilter(self)
+        if popup is not None:
+            popup.removeEventFilter(self)
+            popup.close()
+            self.closed.emit(popup)
+
+    def is_open(self, popup=None):
+        return self.popup is not None and (popup is None or popup is self.popup) and self.popup.isVisible()
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type in _HOVER_EVENTS:
+            if event_type in (QEvent.Enter, QEvent.HoverEnter):
+                if obj is self.popup or self.anchor_rect is None:
+                    self._timer.stop()
+            elif event_type in (QEvent.Leave, QEvent.HoverLeave):
+                self._timer.start()
+            elif obj is self.anchor and self.anchor_rect is not None:
+                # Moving inside the anchor: only the row rectangle keeps the popup open
+                if self.anchor_rect.contains(event.position().toPoint()):
+                    self._timer.stop()
+                elif not self._timer.isActive():
+                    self._timer.start()
+        elif event_type in _GEOMETRY_EVENTS:
+            self._rects = None
+        return False
+
+    def _global_rects(self):
+        if self._rects is None:
+            rect = self.anchor_rect if self.anchor_rect is not None else self.anchor.rect()
+            anchor_rect = QRect(self.anchor.mapToGlobal(rect.topLeft()), rect.size())
+            self._rects = (anchor_rect, self.popup.frameGeometry())
+        return self._rects
+
+    def _check(self):
+        if self.popup is None:
+            return
+        if not self.popup.isVisible():
+            self.close()
+            return
+        position = QCursor.pos()
+        if not any(rect.contains(position) for rect in self._global_rects()):
+            self.close()
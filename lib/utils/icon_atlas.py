@@ -0,0 +1,156 @@
+"""Pre-rendered icon masks packed into one raw ARGB32 atlas plus a JSON index.
+
+    QT_QPA_PLATFORM=offscreen python -m lib.utils.icon_atlas
+
+The atlas is keyed by a content hash of the SVGs, the sizes and the device
+pixel ratios; a stale or missing atlas is simply not loaded, and the app
+rebuilds it after the first paint. At runtime the raw file is memory-mapped
+and every icon is a QImage view into the mapping, nothing is decoded.
+"""
+import glob
+import hashlib
+import json
+import mmap
+import os
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QImage, QPainter, QPixmap
+
+ICON_DIR = "assets/icons"
+ATLAS_DIR = ".cache/icon_atlas"
+ATLAS_SIZES = (16, 18, 24, 32)
+ATLAS_DPRS = (1.0, 2.0)
+ATLAS_WIDTH = 1024
+FORMAT_VERSION = 1
+
+_FORMAT = QImage.Format_ARGB32_Premultiplied
+
+
+def source_hash(icon_dir=ICON_DIR, sizes=ATLAS_SIZES, dprs=ATLAS_DPRS):
+    """Hash over the SVG contents and the rendered variants."""
+    digest = hashlib.sha1(f"{FORMAT_VERSION}|{sizes}|{dprs}".encode())
+    for path in sorted(glob.glob(os.path.join(icon_dir, "*.svg"))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def _key(name, size, device_pixel_ratio):
+    return f"{name}@{size}@{float(device_pixel_ratio):g}"
+
+
+class IconAtlas:
+    """Read-only view of a built atlas; `image()` slices it without copying."""
+
+    def __init__(self, index, buffer, mapping=None):
+        self.index = index
+        self.rects = index["icons"]  # key -> [x, y, width, height] in pixels
+        self.bytes_per_line = index["width"] * 4
+        self._mapping = mapping
+        self._buffer = memoryview(buffer)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __contains__(self, key):
+        return _key(*key) in self.rects
+
+    @classmethod
+    def load(cls, atlas_dir=ATLAS_DIR, icon_dir=ICON_DIR):
+        """The atlas in `atlas_dir`, or None if it is missing or stale."""
+        index_path = os.path.join(atlas_dir, "atlas.json")
+        try:
+            with open(index_path, encoding="utf-8") as file:
+                index = json.load(file)
+            if index.get("hash") != source_hash(icon_dir, tuple(index["sizes"]), tuple(index["dprs"])):
+                return None
+            with open(os.path.join(atlas_dir, "atlas.rgba"), "rb") as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError):
+            return None
+        if len(mapping) != index["width"] * index["height"] * 4:
+            mapping.close()
+            return None
+        return cls(index, mapping, mapping)
+
+    @classmethod
+    def build(cls, atlas_dir=ATLAS_DIR, icon_dir=ICON_DIR, sizes=ATLAS_SIZES, dprs=ATLAS_DPRS):
+        """Render every SVG at every size and ratio, write the atlas and return it."""
+        from PySide6.QtSvg import QSvgRenderer  # only needed when (re)building
+
+        names = sorted(os.path.splitext(os.path.basename(path))[0] for path in glob.glob(os.path.join(icon_dir, "*.svg")))
+        variants = sorted(
+            ((round(size * dpr), name, size, dpr) for name in names for size in sizes for dpr in dprs),
+            reverse=True,
+        )
+
+        # Shelf packing, largest icons first
+        rects = {}
+        x = y = shelf = 0
+        for pixels, name, size, dpr in variants:
+            if x + pixels > ATLAS_WIDTH:
+                x, y, shelf = 0, y + shelf, 0
+            rects[_key(name, size, dpr)] = [x, y, pixels, pixels]
+            x += pixels
+            shelf = max(shelf, pixels)
+        height = max(1, y + shelf)
+
+        image = QImage(ATLAS_WIDTH, height, _FORMAT)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        renderers = {}
+        for pixels, name, size, dpr in variants:
+            renderer = renderers.get(name)
+            if renderer is None:
+                renderer = renderers[name] = QSvgRenderer(os.path.join(icon_dir, f"{name}.svg"))
+                renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+            left, top, width, height_px = rects[_key(name, size, dpr)]
+            renderer.render(painter, QRectF(left, top, width, height_px))
+        painter.end()
+
+        index = {
+            "version": FORMAT_VERSION,
+            "hash": source_hash(icon_dir, tuple(sizes), tuple(dprs)),
+            "width": ATLAS_WIDTH,
+            "height": height,
+            "sizes": list(sizes),
+            "dprs": list(dprs),
+            "icons": rects,
+        }
+        data = bytes(image.constBits())
+        try:
+            os.makedirs(atlas_dir, exist_ok=True)
+            for file_name, content, mode in (("atlas.rgba", data, "wb"), ("atlas.json", json.dumps(index), "w")):
+                path = os.path.join(atlas_dir, file_name)
+                with open(path + ".tmp", mode) as file:
+                    file.write(content)
+                os.replace(path + ".tmp", path)
+        except OSError:
+            return cls(index, data)  # read-only install or a mapped old atlas (Windows): keep it in memory
+        return cls.load(atlas_dir, icon_dir) or cls(index, data)
+
+    def image(self, name, size, device_pixel_ratio=1.0):
+        """QImage view of one icon into the atlas buffer (no copy), or None."""
+        rect = self.rects.get(_key(name, size, device_pixel_ratio))
+        if rect is None:
+            return None
+        x, y, width, height = rect
+        offset = y * self.bytes_per_line + x * 4
+        end = offset + (height - 1) * self.bytes_per_line + width * 4
+        image = QImage(self._buffer[offset:end], width, height, self.bytes_per_line, _FORMAT)
+        image.setDevicePixelRatio(device_pixel_ratio)
+        return image
+
+    def pixmap(self, name, size, device_pixel_ratio=1.0):
+        image = self.image(name, size, device_pixel_ratio)
+        return QPixmap.fromImage(image) if image is not None else None
+
+
+if __name__ == "__main__":
+    from PySide6.QtGui import QGuiApplication
+
+    app = QGuiApplication([])
+    atlas = IconAtlas.build()
+    print(f"{len(atlas)} icon variants in {ATLAS_DIR} ({atlas.index['width']}x{atlas.index['height']})")
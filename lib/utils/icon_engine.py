@@ -0,0 +1,65 @@
+from PySide6.QtCore import QPoint, QRect, QSize
+from PySide6.QtGui import QIcon, QIconEngine
+
+MAX_VARIANTS = 16  # rendered pixmaps kept per icon, least recently used dropped first
+
+
+class LazyIconEngine(QIconEngine):
+    """QIconEngine that renders pixmaps on demand per (extent, mode, device pixel ratio).
+
+    `render(extent, device_pixel_ratio, mode)` must return a QPixmap of
+    extent * device_pixel_ratio pixels with that ratio set. Every variant is
+    rendered once and cached, so painting on a HiDPI screen or moving a window
+    between screens never rescales a pixmap. At most `max_variants` pixmaps
+    are kept; `on_render()` is called after each render so an owning cache
+    can charge the new pixmap to its budget.
+    """
+
+    def __init__(self, render, base_size=32, cache=None, on_render=None, max_variants=MAX_VARIANTS):
+        super().__init__()
+        self.render = render
+        self.base_size = base_size
+        self.cache = cache if cache is not None else {}  # (extent, mode, dpr) -> QPixmap, shared with clones
+        self.on_render = on_render
+        self.max_variants = max_variants
+        self.rendered = 0
+
+    def clone(self):
+        return LazyIconEngine(self.render, self.base_size, self.cache, self.on_render, self.max_variants)
+
+    def key(self):
+        return "LazyIconEngine"
+
+    def actualSize(self, size, mode, state):
+        extent = min(size.width(), size.height())
+        return QSize(extent, extent)
+
+    def availableSizes(self, mode=QIcon.Normal, state=QIcon.Off):
+        return [QSize(self.base_size, self.base_size)]
+
+    def pixmap(self, size, mode, state):
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(self, size, mode, state, scale):
+        extent = min(size.width(), size.height())
+        key = (extent, mode, round(scale, 2))
+        pixmap = self.cache.pop(key, None)
+        if pixmap is not None:
+            self.cache[key] = pixmap  # most recently used last
+            return pixmap
+        pixmap = self.cache[key] = self.render(extent, key[2], mode)
+        while len(self.cache) > self.max_variants:
+            del self.cache[next(iter(self.cache))]
+        self.rendered += 1
+        if self.on_render is not None:
+            self.on_render()
+        return pixmap
+
+    def paint(self, painter, rect, mode, state):
+        device = painter.device()
+        scale = device.devicePixelRatioF() if device is not None else 1.0
+        pixmap = self.scaledPixmap(rect.size(), mode, state, scale)
+        extent = min(rect.width(), rect.height())
+        target = QRect(QPoint(0, 0), QSize(extent, extent))
+        target.moveCenter(rect.center())
+        painter.drawPixmap(target, pixmap)
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Kostenbasierter LRU-Cache mit Speicherbudget und Zählern."""
+
+    def __init__(self, max_cost, cost_func=None):
+        self._entries = OrderedDict()  # key -> (value, cost)
+        self._max_cost = max_cost
+        self._cost_func = cost_func or (lambda value: 1)
+        self.total_cost = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def max_cost(self):
+        return self._max_cost
+
+    def set_max_cost(self, max_cost):
+        """Setzt das Budget neu und verdrängt ggf. alte Einträge."""
+        self._max_cost = max_cost
+        self._evict()
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        cost = self._cost_func(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_cost -= old[1]
+        if cost > self._max_cost:
+            return value  # passt nie ins Budget, nicht cachen
+        self._entries[key] = (value, cost)
+        self.total_cost += cost
+        self._evict()
+        return value
+
+    def get_or_create(self, key, factory):
+        """Liefert den Eintrag oder erzeugt ihn über `factory()`."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return self.put(key, factory())
+
+    def update_cost(self, key):
+        """Kosten eines Eintrags neu berechnen, z.B. nachdem der Wert gewachsen ist."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        cost = self._cost_func(entry[0])
+        self._entries[key] = (entry[0], cost)
+        self.total_cost += cost - entry[1]
+        self._evict()
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self.total_cost -= entry[1]
+        return entry[0]
+
+    def clear(self):
+        self._entries.clear()
+        self.total_cost = 0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "cost": self.total_cost,
+            "max_cost": self._max_cost,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        while self.total_cost > self._max_cost and self._entries:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self.total_cost -= cost
+            self.evictions += 1
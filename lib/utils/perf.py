@@ -0,0 +1,162 @@
+import functools
+import importlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+from PySide6.QtCore import QTimer
+
+# (module, class, method) timed while profiling is enabled
+HOT_PATHS = (
+    ("lib.components.main_window", "MainWindow", "set_view"),
+    ("lib.stores.theme_store", "ThemeStore", "apply_theme"),
+    ("lib.stores.theme_store", "ThemeStore", "apply_light_theme"),
+    ("lib.stores.theme_store", "ThemeStore", "apply_dark_theme"),
+    ("lib.stores.theme_store", "ThemeStore", "set_stylesheet"),
+    ("lib.stores.icon_store", "IconStore", "update_icons"),
+    ("lib.components.sidebar", "Sidebar", "highlight_nav_button"),
+    ("lib.components.sidebar", "Sidebar", "update_menu_visibility"),
+    ("lib.components.virtual_sidebar", "VirtualSidebar", "highlight_nav_button"),
+    ("lib.components.virtual_sidebar", "VirtualSidebar", "update_menu_visibility"),
+)
+MAX_EVENTS = 100_000
+LAG_PROBE_MS = 50
+
+
+class Profiler:
+    """Opt-in timing of UI hot paths with Chrome trace (Perfetto) export.
+
+    While disabled the hot paths are the original, unwrapped methods, so there
+    is no overhead; `enable()` wraps them and `disable()` restores them.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.events = deque(maxlen=MAX_EVENTS)  # Chrome trace events
+        self.stats = {}  # name -> [count, total_ms, max_ms, last_ms]
+        self.lag = deque(maxlen=200)  # event loop lag samples in ms
+        self._originals = []  # (class, name, original function)
+        self._start = time.perf_counter()
+        self._lag_timer = None
+        self._lag_expected = None
+        self._pid = os.getpid()
+
+    def enable(self, hot_paths=HOT_PATHS):
+        if self.enabled:
+            return
+        self.enabled = True
+        for module_name, class_name, method_name in hot_paths:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            original = cls.__dict__.get(method_name)
+            if original is None:
+                continue
+            self._originals.append((cls, method_name, original))
+            setattr(cls, method_name, self._wrap(original, f"{class_name}.{method_name}"))
+        self._start_lag_probe()
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for cls, method_name, original in reversed(self._originals):
+            setattr(cls, method_name, original)
+        self._originals.clear()
+        if self._lag_timer is not None:
+            self._lag_timer.stop()
+
+    def span(self, name, category="app"):
+        """Context manager timing a custom block; a no-op while disabled."""
+        return _Span(self, name, category) if self.enabled else nullcontext()
+
+    def record(self, name, start, end, category="hot_path"):
+        duration_ms = (end - start) * 1000
+        self.events.append({
+            "name": name, "cat": category, "ph": "X",
+            "ts": (start - self._start) * 1e6, "dur": duration_ms * 1000,
+            "pid": self._pid, "tid": threading.get_ident(),
+        })
+        entry = self.stats.get(name)
+        if entry is None:
+            self.stats[name] = [1, duration_ms, duration_ms, duration_ms]
+        else:
+            entry[0] += 1
+            entry[1] += duration_ms
+            entry[2] = max(entry[2], duration_ms)
+            entry[3] = duration_ms
+
+    def summary(self):
+        """Per hot path: count, avg/max/last ms, plus event loop lag."""
+        result = {
+            name: {"count": count, "avg_ms": total / count, "max_ms": maximum, "last_ms": last}
+            for name, (count, total, maximum, last) in self.stats.items()
+        }
+        samples = list(self.lag)
+        result["event_loop_lag"] = {
+            "count": len(samples),
+            "avg_ms": sum(samples) / len(samples) if samples else 0.0,
+            "max_ms": max(samples, default=0.0),
+            "last_ms": samples[-1] if samples else 0.0,
+        }
+        return result
+
+    def reset(self):
+        self.events.clear()
+        self.stats.clear()
+        self.lag.clear()
+
+    def export_chrome_trace(self, path):
+        """Write the recorded events as Chrome trace JSON (chrome://tracing, ui.perfetto.dev)."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, file)
+        return path
+
+    def _wrap(self, function, name):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(name, start, time.perf_counter())
+        return timed
+
+    def _start_lag_probe(self):
+        if self._lag_timer is None:
+            self._lag_timer = QTimer()
+            self._lag_timer.setInterval(LAG_PROBE_MS)
+            self._lag_timer.timeout.connect(self._on_lag_probe)
+        self._lag_expected = time.perf_counter() + LAG_PROBE_MS / 1000
+        self._lag_timer.start()
+
+    def _on_lag_probe(self):
+        now = time.perf_counter()
+        lag_ms = max(0.0, (now - self._lag_expected) * 1000)
+        self._lag_expected = now + LAG_PROBE_MS / 1000
+        self.lag.append(lag_ms)
+        self.events.append({
+            "name": "event_loop_lag", "ph": "C", "ts": (now - self._start) * 1e6,
+            "pid": self._pid, "tid": threading.get_ident(), "args": {"lag_ms": lag_ms},
+        })
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "category", "start")
+
+    def __init__(self, profiler, name, category):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter(), self.category)
+        return False
+
+
+profiler = Profiler()
@@ -0,0 +1,193 @@
+import asyncio
+import functools
+import math
+from collections import deque
+
+from PySide6.QtCore import QCoreApplication, QDeadlineTimer, QEvent, QObject, Qt, QTimer, Signal
+
+STEP_INTERVAL_MS = 4  # how often the loop steps while callbacks are ready
+IDLE_POLL_MS = 50  # I/O poll interval while only sockets or pipes are waited on
+LAG_PROBE_INTERVAL = 0.1  # seconds
+LAG_SAMPLES = 100
+
+_driver = None
+
+
+class QtAsyncioDriver(QObject):
+    """Runs a standard asyncio event loop in short slices from the Qt event loop.
+
+    Every step runs the callbacks that are ready and polls I/O without
+    blocking, so sockets, subprocesses and timers behave as usual while
+    `app.exec()` keeps control. Tasks started with an owner widget are
+    cancelled when the owner is hidden or destroyed.
+
+    The step timer only runs while there is something to do: every
+    `interval_ms` while callbacks are ready, at the due time of the next
+    asyncio timer, and every IDLE_POLL_MS while I/O is waited on. An idle
+    loop does not wake the GUI thread; scheduling a callback restarts it.
+    """
+    _wake = Signal()  # queued into the GUI thread for call_soon_threadsafe()
+
+    def __init__(self, interval_ms=STEP_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.interval_ms = interval_ms
+        self.lag = deque(maxlen=LAG_SAMPLES)  # ms a 100 ms sleep overshot
+        self._owners = {}  # id(owner) -> set of tasks
+        self._probe = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)  # a coarse timer may fire before the asyncio timer is due
+        self._timer.timeout.connect(self.step)
+        self._wake.connect(self._schedule)
+        self._watch_loop()
+
+    def start(self):
+        if self._probe is None:
+            self._probe = self.loop.create_task(self._measure_lag())
+        self._schedule()
+        return self
+
+    def step(self):
+        """Run one iteration of the asyncio loop without blocking."""
+        if self.loop.is_closed() or self.loop.is_running():
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self._timer.stop()  # drop the wakeup the stop callback itself requested
+        self._schedule()
+
+    def _watch_loop(self):
+        # Restart the step timer whenever the loop gets work from outside a step
+        loop = self.loop
+        for name in ("call_soon", "call_at"):
+            def scheduled(*args, _schedule=getattr(loop, name), **kwargs):
+                handle = _schedule(*args, **kwargs)
+                if not loop.is_running():
+                    self._schedule()
+                return handle
+            setattr(loop, name, scheduled)
+
+        def scheduled_threadsafe(*args, _schedule=loop.call_soon_threadsafe, **kwargs):
+            handle = _schedule(*args, **kwargs)
+            self._wake.emit()
+            return handle
+        loop.call_soon_threadsafe = scheduled_threadsafe
+
+    def _schedule(self):
+        if self.loop.is_closed() or self.loop.is_running():
+            return  # step() reschedules when it is done
+        delay = self._next_delay_ms()
+        if delay is None:
+            self._timer.stop()
+        elif not self._timer.isActive() or self._timer.remainingTime() > delay:
+            self._timer.start(delay)
+
+    def _next_delay_ms(self):
+        """Milliseconds until the loop has work, None if it is idle."""
+        # BaseEventLoop keeps ready callbacks and timers in these (stable) attributes
+        loop = self.loop
+        if loop._ready:
+            return self.interval_ms
+        delays = []
+        if loop._scheduled:
+            delays.append(max(self.interval_ms, math.ceil((loop._scheduled[0].when() - loop.time()) * 1000)))
+        selector = getattr(loop, "_selector", None)
+        if selector is None or len(selector.get_map()) > 1:  # more than the loop's own wakeup pipe
+            delays.append(IDLE_POLL_MS)
+        return min(delays, default=None)
+
+    def run(self, coro, owner=None):
+        """Schedule a coroutine; with `owner` it is cancelled when the owner hides or is destroyed."""
+        task = self.loop.create_task(coro)
+        if owner is not None:
+            key = id(owner)
+            tasks = self._owners.get(key)
+            if tasks is None:
+                tasks = self._owners[key] = set()
+                owner.installEventFilter(self)
+                owner.destroyed.connect(lambda *_, key=key: self._cancel_key(key, forget=True))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        return task
+
+    def cancel_owner(self, owner):
+        return self._cancel_key(id(owner))
+
+    def run_until_complete(self, coro, timeout_ms=None):
+        """Drive the Qt loop until `coro` is done (scripts and tests) and return its result."""
+        task = self.run(coro)
+        deadline = QDeadlineTimer(timeout_ms if timeout_ms is not None else QDeadlineTimer.Forever)
+        while not task.done():
+            if deadline.hasExpired():
+                task.cancel()
+                self.step()
+                break
+            QCoreApplication.processEvents()
+            self.step()
+        return task.result()
+
+    def stats(self):
+        samples = list(self.lag)
+        return {
+            "tasks": len(asyncio.all_tasks(self.loop)) - (1 if self._probe is not None and not self._probe.done() else 0),
+            "lag_ms": samples[-1] if samples else 0.0,
+            "avg_lag_ms": sum(samples) / len(samples) if samples else 0.0,
+            "max_lag_ms": max(samples, default=0.0),
+        }
+
+    def close(self):
+        """Cancel all tasks and close the loop."""
+        self._timer.stop()
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+
+    def eventFilter(self, obj, event):
+        # Hidden by the ViewManager, not e.g. by minimizing the window
+        if event.type() == QEvent.Hide and not event.spontaneous():
+            self._cancel_key(id(obj))
+        return False
+
+    def _cancel_key(self, key, forget=False):
+        tasks = self._owners.pop(key, ()) if forget else self._owners.get(key, ())
+        for task in list(tasks):
+            task.cancel()
+        return len(tasks)
+
+    async def _measure_lag(self):
+        while True:
+            start = self.loop.time()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            self.lag.append(max(0.0, (self.loop.time() - start - LAG_PROBE_INTERVAL) * 1000))
+
+
+def install(interval_ms=STEP_INTERVAL_MS):
+    """Create and start the shared driver; call once after creating the QApplication."""
+    global _driver
+    if _driver is None:
+        _driver = QtAsyncioDriver(interval_ms).start()
+    return _driver
+
+
+def driver():
+    if _driver is None:
+        raise RuntimeError("Qt asyncio mode is not enabled, call qt_asyncio.install() first")
+    return _driver
+
+
+def async_slot(method):
+    """Decorator to connect a coroutine method to a signal.
+
+    Calling the method schedules the coroutine with the instance as owner,
+    so it is cancelled when the view is hidden or evicted.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        return driver().run(method(self, *args), owner=self if isinstance(self, QObject) else None)
+    return wrapper
@@ -0,0 +1,195 @@
+import csv
+import queue
+import sqlite3
+import threading
+import time
+from itertools import islice
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+CHUNK_SIZE = 1000
+MAX_BUFFERED_CHUNKS = 4  # read-ahead in lazy mode; streaming reads one chunk at a time
+
+
+def iter_csv(path, skip_header=True, encoding="utf-8"):
+    """Rows of a CSV file as lists of strings."""
+    with open(path, newline="", encoding=encoding) as file:
+        reader = csv.reader(file)
+        if skip_header:
+            next(reader, None)
+        yield from reader
+
+
+def iter_sqlite(path, query, params=()):
+    """Rows of a SQLite query; the connection lives in the thread that iterates."""
+    connection = sqlite3.connect(path)
+    try:
+        yield from connection.execute(query, params)
+    finally:
+        connection.close()
+
+
+class _LoaderThread(QThread):
+    """Reads the source in chunks into a queue.
+
+    A chunk is only read after taking a slot, and the GUI thread returns the
+    slot once the chunk is inserted. So the worker never competes with the
+    GUI thread for the GIL while it inserts more than `slots` chunks ahead.
+    """
+    chunk_ready = Signal()
+    done = Signal(str)  # error message, empty on success or cancel
+
+    def __init__(self, source, chunk_size, buffer, slots, cancelled):
+        super().__init__()
+        self.source = source
+        self.chunk_size = chunk_size
+        self.buffer = buffer
+        self.slots = slots
+        self.cancelled = cancelled
+
+    def run(self):
+        rows = None
+        error = ""
+        try:
+            # Call the factory here so generators (and e.g. SQLite connections) are created in this thread
+            rows = iter(self.source() if callable(self.source) else self.source)
+            while self._take_slot():
+                chunk = list(islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+                self.buffer.put(chunk)
+                self.chunk_ready.emit()
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+            self.done.emit(error)
+
+    def _take_slot(self):
+        while not self.cancelled.is_set():
+            if self.slots.acquire(timeout=0.05):
+                return not self.cancelled.is_set()
+        return False
+
+
+class RowLoader(QObject):
+    """Streams rows from an iterable on a worker thread into a model in chunks.
+
+    `insert_rows(rows)` is called on the GUI thread with one list per batch,
+    e.g. a model method wrapping `beginInsertRows`/`endInsertRows`.
+    With `lazy=True` only the first chunk is inserted on arrival; further
+    chunks wait for `fetch_more()`, which models call from `fetchMore()`.
+    Otherwise every chunk is inserted as soon as it is read.
+    """
+    progress = Signal(int)  # rows inserted so far
+    finished = Signal(int)  # total rows inserted
+    failed = Signal(str)
+
+    def __init__(self, source, insert_rows, chunk_size=CHUNK_SIZE, lazy=False, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.insert_rows = insert_rows
+        self.chunk_size = chunk_size
+        self.lazy = lazy
+        self.rows_loaded = 0
+        self.chunks_loaded = 0
+        self.cancelled = False
+        self.error = ""
+        self._buffer = queue.Queue()
+        self._slots = threading.Semaphore(MAX_BUFFERED_CHUNKS if lazy else 1)
+        self._cancel_event = threading.Event()
+        self._reading = False
+        self._fetch_requested = False
+        self._started_at = None
+        self._finished_at = None
+        self._thread = None
+
+    def start(self):
+        self._thread = _LoaderThread(self.source, self.chunk_size, self._buffer, self._slots, self._cancel_event)
+        self._thread.chunk_ready.connect(self._on_chunk_ready)
+        self._thread.done.connect(self._on_done)
+        self._reading = True
+        self._started_at = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def is_running(self):
+        return self._reading
+
+    def can_fetch_more(self):
+        return not self.cancelled and (self._reading or not self._buffer.empty())
+
+    def fetch_more(self):
+        """Insert the next buffered chunk, or the next one to arrive."""
+        if not self._insert(max_chunks=1) and self._reading:
+            self._fetch_requested = True
+
+    def cancel(self, wait_ms=0):
+        """Stop reading; rows already inserted stay in the model."""
+        if self.cancelled or self._thread is None:
+            return
+        self.cancelled = True
+        self._cancel_event.set()
+        while not self._buffer.empty():
+            self._buffer.get_nowait()
+        if wait_ms:
+            self._thread.wait(wait_ms)
+
+    def stats(self):
+        end = self._finished_at or time.perf_counter()
+        return {
+            "rows": self.rows_loaded,
+            "chunks": self.chunks_loaded,
+            "running": self._reading,
+            "cancelled": self.cancelled,
+            "elapsed_ms": (end - self._started_at) * 1000 if self._started_at else 0.0,
+        }
+
+    def _on_chunk_ready(self):
+        if not self.lazy:
+            self._insert()
+        elif self._fetch_requested or not self.rows_loaded:
+            self._fetch_requested = False
+            self._insert(max_chunks=1)
+
+    def _insert(self, max_chunks=None):
+        # Everything already buffered goes into a single insert
+        rows = []
+        chunks = 0
+        while not self.cancelled and (max_chunks is None or chunks < max_chunks):
+            try:
+                rows.extend(self._buffer.get_nowait())
+            except queue.Empty:
+                break
+            chunks += 1
+        if not rows:
+            return False
+        self.insert_rows(rows)
+        for _ in range(chunks):
+            self._slots.release()
+        self.rows_loaded += len(rows)
+        self.chunks_loaded += chunks
+        self.progress.emit(self.rows_loaded)
+        self._check_finished()
+        return True
+
+    def _check_finished(self):
+        if not self._reading and not self.cancelled and not self.error and self._buffer.empty() and self._finished_at is None:
+            self._finished_at = time.perf_counter()
+            self.finished.emit(self.rows_loaded)
+
+    def _on_done(self, error):
+        self._reading = False
+        self._thread.wait()
+        if error:
+            self.error = error
+            self._finished_at = time.perf_counter()
+            self.failed.emit(error)
+        if not self.lazy:
+            self._insert()
+        elif self._fetch_requested:
+            self._fetch_requested = False
+            self._insert(max_chunks=1)
+        self._check_finished()
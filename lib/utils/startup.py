@@ -0,0 +1,77 @@
+import time
+from contextlib import contextmanager
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+FIRST_PAINT_BUDGET_MS = 400
+
+
+class StartupProfile(QObject):
+    """Measures startup phases up to the first paint and the deferred work after it.
+
+    Phases are timed with `phase()`; `after_first_paint()` runs further steps
+    one per event loop turn once the window has painted, so they never delay
+    the first frame.
+    """
+
+    def __init__(self, start=None, budget_ms=FIRST_PAINT_BUDGET_MS):
+        super().__init__()
+        self.start = start if start is not None else time.perf_counter()
+        self.budget_ms = budget_ms
+        self.phases = []  # (name, offset_ms, duration_ms)
+        self.first_paint_ms = None
+        self._window = None
+        self._deferred = []
+        self._on_done = None
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def mark(self, name, since_ms=None):
+        """Record a phase from `since_ms` (default: the end of the last phase) until now."""
+        if since_ms is None:
+            since_ms = self.phases[-1][1] + self.phases[-1][2] if self.phases else 0.0
+        now = self.elapsed_ms()
+        self.phases.append((name, since_ms, now - since_ms))
+
+    @contextmanager
+    def phase(self, name):
+        begin = self.elapsed_ms()
+        try:
+            yield
+        finally:
+            self.mark(name, begin)
+
+    def after_first_paint(self, window, steps, on_done=None):
+        """Run `steps` ([(name, callable)]) after the first paint of `window`."""
+        self._window = window
+        self._deferred = list(steps)
+        self._on_done = on_done
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and obj is self._window and self.first_paint_ms is None:
+            obj.removeEventFilter(self)
+            self.mark("first_paint")
+            self.first_paint_ms = self.elapsed_ms()
+            QTimer.singleShot(0, self._run_next)
+        return False
+
+    def _run_next(self):
+        if not self._deferred:
+            if self._on_done is not None:
+                self._on_done(self)
+            return
+        name, step = self._deferred.pop(0)
+        with self.phase(f"deferred:{name}"):
+            step()
+        QTimer.singleShot(0, self._run_next)
+
+    def report(self):
+        """Per-phase timing table."""
+        lines = [f"{'phase':<28}{'start ms':>10}{'took ms':>10}"]
+        lines += [f"{name:<28}{offset:>10.1f}{duration:>10.1f}" for name, offset, duration in self.phases]
+        if self.first_paint_ms is not None:
+            verdict = "ok" if self.first_paint_ms <= self.budget_ms else "OVER BUDGET"
+            lines.append(f"time to first paint: {self.first_paint_ms:.1f} ms (budget {self.budget_ms} ms, {verdict})")
+        return "\n".join(lines)
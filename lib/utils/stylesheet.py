@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+from string import Template
+
+
+class StylesheetCompiler:
+    """Compiles a themed QSS template into one cached stylesheet per theme.
+
+    The template uses `$token` placeholders, the themes file maps each theme
+    name to its token table. Compiled stylesheets are kept in memory and,
+    if `cache_dir` is set, on disk keyed by the source file mtimes.
+    """
+
+    def __init__(self, template_path, themes_path, cache_dir=None):
+        self.template_path = template_path
+        self.themes_path = themes_path
+        self.cache_dir = cache_dir
+        self._template = None
+        self._themes = None
+        self._compiled = {}
+
+    @property
+    def themes(self):
+        """Theme name -> theme spec (dark_mode, shadow, tokens)."""
+        if self._themes is None:
+            with open(self.themes_path, encoding="utf-8") as file:
+                self._themes = json.load(file)
+        return self._themes
+
+    def theme(self, name):
+        return self.themes[name]
+
+    def compile(self, name):
+        """Compiled QSS for the theme `name`."""
+        qss = self._compiled.get(name)
+        if qss is not None:
+            return qss
+
+        cache_file = self._cache_file(name)
+        if cache_file is not None and os.path.exists(cache_file):
+            with open(cache_file, encoding="utf-8") as file:
+                qss = file.read()
+        else:
+            if self._template is None:
+                with open(self.template_path, encoding="utf-8") as file:
+                    self._template = Template(file.read())
+            qss = self._template.substitute(self.theme(name)["tokens"])
+            if cache_file is not None:
+                self._write_cache(cache_file, qss)
+
+        self._compiled[name] = qss
+        return qss
+
+    def invalidate(self):
+        """Drop all in-memory state so the next compile re-reads the sources."""
+        self._template = None
+        self._themes = None
+        self._compiled.clear()
+
+    def _cache_file(self, name):
+        if not self.cache_dir:
+            return None
+        try:
+            stamp = "|".join(str(os.stat(path).st_mtime_ns) for path in (self.template_path, self.themes_path))
+        except OSError:
+            return None
+        digest = hashlib.sha1(f"{name}|{stamp}".encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"style-{name}-{digest}.qss")
+
+    @staticmethod
+    def _write_cache(cache_file, qss):
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as file:
+                file.write(qss)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Disk cache is optional
@@ -0,0 +1,133 @@
+from contextlib import contextmanager
+
+from PySide6.QtWidgets import QApplication
+from shiboken6 import isValid
+
+_current = None  # innermost active batch; widgets live on the GUI thread only
+_stats = {
+    "batches": 0,
+    "style_requests": 0, "styles_applied": 0,
+    "recolor_requests": 0, "recolors_run": 0,
+    "icon_requests": 0, "icons_applied": 0,
+}
+
+
+class _Batch:
+    def __init__(self, scopes):
+        self.scopes = list(scopes)
+        self.freeze_windows = not scopes  # no scope given: also freeze the windows of touched widgets
+        self.frozen = []  # widgets whose updates this batch disabled
+        self.flushing = False
+        self.styles = {}  # widget -> None, insertion ordered
+        self.recolors = {}  # widget -> callable, reads the palette after the styles are applied
+        self.icons = {}  # widget -> callable that sets the icon/pixmap, last one wins
+
+    def freeze(self, widgets):
+        for widget in widgets:
+            if widget is not None and widget not in self.frozen and isValid(widget) and widget.updatesEnabled():
+                widget.setUpdatesEnabled(False)
+                self.frozen.append(widget)
+
+    def unfreeze(self):
+        for widget in self.frozen:
+            if isValid(widget):
+                widget.setUpdatesEnabled(True)
+        self.frozen.clear()
+
+    def flush(self):
+        if self.freeze_windows:
+            touched = (*self.styles, *self.recolors, *self.icons)
+            self.freeze(dict.fromkeys(widget.window() for widget in touched if isValid(widget)))
+        for widget in self.styles:
+            if isValid(widget):  # may have been deleted since the request
+                style = widget.style()
+                style.unpolish(widget)
+                style.polish(widget)
+                _stats["styles_applied"] += 1
+        # Recoloring runs right away now, but the icons it sets are still collected
+        self.flushing = True
+        for widget, recolor in self.recolors.items():
+            if isValid(widget):
+                recolor()
+                _stats["recolors_run"] += 1
+        for widget, set_icon in self.icons.items():
+            if isValid(widget):
+                set_icon()
+                _stats["icons_applied"] += 1
+
+
+@contextmanager
+def ui_batch(*scopes):
+    """Collect repolish and icon updates of one user action and apply them once.
+
+    Updates stay disabled on `scopes` (default: the active window) from entering
+    the outermost batch until it has been flushed; each widget is repolished
+    and gets its icon set at most once. Batches nest, inner ones join the
+    outer batch.
+    """
+    global _current
+    outer = _current
+    if outer is not None:
+        outer.freeze(scopes)
+        yield outer
+        return
+    batch = _current = _Batch(scopes)
+    _stats["batches"] += 1
+    batch.freeze(scopes or [QApplication.activeWindow()])
+    try:
+        yield batch
+    finally:
+        try:
+            batch.flush()
+        finally:
+            _current = None
+            batch.unfreeze()
+
+
+def active():
+    return _current is not None
+
+
+def repolish(widget):
+    """Re-apply the stylesheet to `widget`, e.g. after a dynamic property changed."""
+    _stats["style_requests"] += 1
+    if _current is None or _current.flushing:
+        _stats["styles_applied"] += 1
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        return
+    _current.styles[widget] = None
+
+
+def recolor(widget, apply):
+    """Run `apply()` now, or in a batch once after all styles are applied; returns True if deferred."""
+    _stats["recolor_requests"] += 1
+    if _current is None or _current.flushing:
+        _stats["recolors_run"] += 1
+        apply()
+        return False
+    _current.recolors[widget] = apply
+    return True
+
+
+def set_icon(widget, apply):
+    """Run `apply()` (a setIcon/setPixmap call) now, or once at the end of the batch."""
+    _stats["icon_requests"] += 1
+    if _current is None:
+        _stats["icons_applied"] += 1
+        apply()
+        return
+    _current.icons[widget] = apply
+
+
+def stats():
+    """Counters since start; `coalesced` counts requests that never had to be applied."""
+    coalesced = (_stats["style_requests"] - _stats["styles_applied"]
+                 + _stats["recolor_requests"] - _stats["recolors_run"]
+                 + _stats["icon_requests"] - _stats["icons_applied"])
+    return {**_stats, "coalesced": coalesced}
+
+
+def reset_stats():
+    for key in _stats:
+        _stats[key] = 0
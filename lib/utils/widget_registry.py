@@ -0,0 +1,119 @@
+import weakref
+
+from shiboken6 import isValid
+
+
+class IconEntry:
+    """Registrierungsdaten eines Widgets: Icon-Name, Größe und Dark-Mode-Variante."""
+    __slots__ = ("ref", "icon_name", "size", "icon_name_dark", "applied_key", "dark_mode", "pending_dark_mode", "pending_color", "__weakref__")
+
+    def __init__(self, ref, icon_name, size, icon_name_dark):
+        self.ref = ref
+        self.icon_name = icon_name
+        self.size = size
+        self.icon_name_dark = icon_name_dark
+        self.applied_key = None  # Cache-Schlüssel des aktuell gesetzten Icons
+        self.dark_mode = None  # Theme des aktuell gesetzten Icons
+        self.pending_dark_mode = None  # zurückgestelltes Update für unsichtbare Widgets
+        self.pending_color = None  # Farbe des zurückgestellten Updates, None = Standardfarbe
+
+    @property
+    def widget(self):
+        widget = self.ref()
+        return widget if widget is not None and isValid(widget) else None
+
+
+class WidgetRegistry:
+    """Schwache Widget-Registry mit O(1)-Zugriff über Widget und Icon-Name.
+
+    Widgets werden nur schwach referenziert und beim `destroyed`-Signal
+    bzw. beim Freigeben des Python-Wrappers automatisch entfernt.
+    """
+
+    def __init__(self):
+        self._entries = {}  # id(widget) -> IconEntry
+        self._by_icon = {}  # icon_name -> {id(widget), ...}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, widget):
+        return id(widget) in self._entries
+
+    def __iter__(self):
+        """Liefert (widget, entry) für alle noch lebenden Widgets."""
+        for key, entry in list(self._entries.items()):
+            widget = entry.widget
+            if widget is None:
+                self._discard(key, entry)
+                continue
+            yield widget, entry
+
+    def add(self, widget, icon_name, size=32, icon_name_dark=None):
+        """Registriert ein Widget oder aktualisiert dessen Eintrag."""
+        key = id(widget)
+        entry = self._entries.get(key)
+        if entry is not None and entry.widget is widget:
+            if entry.icon_name != icon_name:
+                self._unindex(key, entry.icon_name)
+                entry.icon_name = icon_name
+                self._by_icon.setdefault(icon_name, set()).add(key)
+            entry.size = size
+            entry.icon_name_dark = icon_name_dark
+            return entry
+
+        ref = weakref.ref(widget, lambda _, k=key: self._discard_key(k))
+        entry = IconEntry(ref, icon_name, size, icon_name_dark)
+        self._entries[key] = entry
+        self._by_icon.setdefault(icon_name, set()).add(key)
+        entry_ref = weakref.ref(entry)
+        widget.destroyed.connect(lambda *_, k=key, e=entry_ref: self._discard(k, e()))
+        return entry
+
+    def get(self, widget):
+        entry = self._entries.get(id(widget))
+        if entry is None or entry.widget is not widget:
+            return None
+        return entry
+
+    def remove(self, widget):
+        entry = self.get(widget)
+        if entry is not None:
+            self._discard(id(widget), entry)
+
+    def widgets_for_icon(self, icon_name):
+        """Alle lebenden Widgets, die das Icon `icon_name` verwenden."""
+        widgets = []
+        for key in list(self._by_icon.get(icon_name, ())):
+            entry = self._entries.get(key)
+            if entry is None:
+                self._unindex(key, icon_name)
+                continue
+            widget = entry.widget
+            if widget is None:
+                self._discard(key, entry)
+            else:
+                widgets.append(widget)
+        return widgets
+
+    def clear(self):
+        self._entries.clear()
+        self._by_icon.clear()
+
+    def _discard_key(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry.ref() is None:
+            self._discard(key, entry)
+
+    def _discard(self, key, entry):
+        if entry is None or self._entries.get(key) is not entry:
+            return
+        del self._entries[key]
+        self._unindex(key, entry.icon_name)
+
+    def _unindex(self, key, icon_name):
+        keys = self._by_icon.get(icon_name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_icon[icon_name]
@@ -1,15 +1,25 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QFrame, QLabel,
-    QPushButton, QComboBox, QHBoxLayout, QMessageBox, QHeaderView
+    QWidget, QVBoxLayout, QTableView, QFrame, QLabel, QLineEdit,
+    QPushButton, QHBoxLayout, QMessageBox, QHeaderView, QAbstractItemView
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, QTimer
+
+from lib.components.user_table import (
+    AGE_COLUMN, ACTIONS_COLUMN, AgeComboDelegate, DeleteActionDelegate, UserFilterProxyModel, UserTableModel
+)
+from lib.utils.row_loader import CHUNK_SIZE, RowLoader, iter_csv, iter_sqlite
+
+ROW_HEIGHT = 32
+FILTER_DELAY_MS = 150  # wait for a typing pause before filtering all records
 
 
 class HomeView(QWidget):
+    pinned = True  # Table edits live only in the model, never evict
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_edit_mode = False  # Track edit mode state
+        self.loader = None  # RowLoader of the running import, if any
         self.init_ui()
 
     def init_ui(self):
@@ -22,42 +32,55 @@ class HomeView(QWidget):
         card.setObjectName("Card")
         card_layout = QVBoxLayout(card)
 
-        # Add title and edit button above the table
+        # Add title, filter and edit button above the table
         title_layout = QHBoxLayout()
         title = QLabel("User Information")
         title.setStyleSheet("font-size: 16px; font-weight: bold;")
         title_layout.addWidget(title)
 
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter by name")
+        self.filter_edit.setClearButtonEnabled(True)
+        title_layout.addWidget(self.filter_edit)
+
         self.edit_button = QPushButton("Edit")
         self.edit_button.clicked.connect(self.toggle_edit_mode)
         title_layout.addWidget(self.edit_button, alignment=Qt.AlignRight)
 
         card_layout.addLayout(title_layout)
 
-        # Add table to the card
-        self.table = QTableWidget(3, 3)  # Three columns: Name, Age, Actions
-        self.table.setHorizontalHeaderLabels(["Name", "Age", "Actions"])
-        self.table.setItem(0, 0, QTableWidgetItem("Alice"))
-        self.table.setItem(0, 1, QTableWidgetItem("25"))
-        self.add_delete_button(0)
-
-        self.table.setItem(1, 0, QTableWidgetItem("Bob"))
-        self.table.setItem(1, 1, QTableWidgetItem("30"))
-        self.add_delete_button(1)
-
-        self.table.setItem(2, 0, QTableWidgetItem("Charlie"))
-        self.table.setItem(2, 1, QTableWidgetItem("35"))
-        self.add_delete_button(2)
-
-        # Hide the row numbers
+        # Model/view table: no widgets per row, so tens of thousands of records stay cheap
+        self.model = UserTableModel([("Alice", 25), ("Bob", 30), ("Charlie", 35)], self)
+        self.proxy = UserFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(lambda: self.proxy.set_filter_text(self.filter_edit.text()))
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
+
+        self.table = QTableView()
+        self.delete_delegate = DeleteActionDelegate(self.table)
+        self.delete_delegate.delete_requested.connect(self.confirm_delete)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self.delete_delegate)
+        self.table.setItemDelegateForColumn(AGE_COLUMN, AgeComboDelegate(self.table))
+
+        # Hide the row numbers and use fixed row heights (no per-row size hints)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+
+        # Styling and interaction
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Disable editing by default
+        self.table.setSortingEnabled(True)
+        self.table.setModel(self.proxy)
 
-        # Adjust column stretching and styling
+        # Adjust column stretching (the header has sections only once a model is set)
         self.table.horizontalHeader().setStretchLastSection(False)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.table.setAlternatingRowColors(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)  # Disable editing by default
-        self.table.cellDoubleClicked.connect(self.handle_double_click)
+        self.table.sortByColumn(-1, Qt.AscendingOrder)  # keep insertion order until a header is clicked
 
         card_layout.addWidget(self.table)
 
@@ -69,30 +92,47 @@ class HomeView(QWidget):
 
         # Add card to the main layout
         layout.addWidget(card)
-        layout.addStretch()
 
     def add_row(self):
         """Add a new row to the table with default values."""
-        row_count = self.table.rowCount()
-        self.table.insertRow(row_count)
-        self.table.setItem(row_count, 0, QTableWidgetItem("New User"))
-        self.table.setItem(row_count, 1, QTableWidgetItem("0"))  # Default Age
-        self.add_delete_button(row_count)
-
-    def add_delete_button(self, row):
-        """Add a delete button in the last column of a row."""
-        delete_button = QPushButton()
-        icon_path = (
-            "assets/icons/trash_gray.png" if not self.is_edit_mode else "assets/icons/trash_red.png"
-        )
-        delete_button.setIcon(QIcon(icon_path))  # Use appropriate icon
-        delete_button.setStyleSheet("border: none; background: transparent; padding: 5px;")
-        delete_button.clicked.connect(lambda: self.confirm_delete(row))
-        delete_button.setProperty("row", row)  # Store the row number
-        self.table.setCellWidget(row, 2, delete_button)
-
-    def confirm_delete(self, row):
-        """Show a confirmation dialog and delete the row if confirmed."""
+        row_id, = self.model.insert_records([("New User", 0)])
+        row = self.model.row_for_id(row_id)
+        self.table.scrollTo(self.proxy.mapFromSource(self.model.index(row, 0)))
+        return row_id
+
+    def load_records(self, records):
+        """Append (name, age) records in one batch."""
+        return self.model.insert_records(records)
+
+    def load_from(self, source, lazy=True, chunk_size=CHUNK_SIZE):
+        """Stream (name, age) rows from an iterable (or a factory returning one) on a worker thread.
+
+        With `lazy` further chunks are only read when the table scrolls to the end.
+        """
+        self.cancel_loading()
+        self.loader = RowLoader(source, self.model.insert_records, chunk_size, lazy=lazy, parent=self)
+        self.model.loader = self.loader
+        return self.loader.start()
+
+    def load_csv(self, path, lazy=True):
+        return self.load_from(lambda: iter_csv(path), lazy=lazy)
+
+    def load_sqlite(self, path, query="SELECT name, age FROM users", lazy=True):
+        return self.load_from(lambda: iter_sqlite(path, query), lazy=lazy)
+
+    def cancel_loading(self, wait_ms=0):
+        if self.loader is not None:
+            self.loader.cancel(wait_ms)
+
+    def on_suspend(self):
+        # Switching views stops a running import; loaded rows stay
+        self.cancel_loading()
+
+    def on_evict(self):
+        self.cancel_loading(wait_ms=1000)
+
+    def confirm_delete(self, row_id):
+        """Show a confirmation dialog and delete the record if confirmed."""
         if not self.is_edit_mode:
             return  # Only allow deletion in edit mode
 
@@ -103,35 +143,20 @@ class HomeView(QWidget):
             QMessageBox.Yes | QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
-            self.table.removeRow(row)
+            self.model.remove_ids([row_id])
+
+    def delete_rows(self, row_ids):
+        """Delete several records at once by row id."""
+        return self.model.remove_ids(row_ids)
 
     def toggle_edit_mode(self):
         """Enable or disable editing for the table."""
         self.is_edit_mode = not self.is_edit_mode
-        # Update delete button icons based on edit mode
-        for row in range(self.table.rowCount()):
-            self.add_delete_button(row)
+        self.model.set_editable(self.is_edit_mode)  # repaints the delete icons
 
         if self.is_edit_mode:
-            self.table.setEditTriggers(QTableWidget.DoubleClicked | QTableWidget.SelectedClicked)
+            self.table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked)
             self.edit_button.setText("Stop Editing")
         else:
-            self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+            self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
             self.edit_button.setText("Edit")
-
-    def handle_double_click(self, row, column):
-        """Enable dropdown in the second column on double-click, only in edit mode."""
-        if not self.is_edit_mode or column != 1:
-            return  # Only allow in edit mode and for the second column
-
-        combo = QComboBox()
-        combo.addItems(["18", "25", "30", "35", "40", "50"])
-        combo.setCurrentText(self.table.item(row, column).text())
-        combo.currentIndexChanged.connect(lambda: self.update_cell_with_dropdown(row, column, combo))
-        self.table.setCellWidget(row, column, combo)
-
-    def update_cell_with_dropdown(self, row, column, combo):
-        """Update the table cell with the selected value from the dropdown."""
-        selected_value = combo.currentText()
-        self.table.setItem(row, column, QTableWidgetItem(selected_value))
-        self.table.setCellWidget(row, column, None)  # Remove the combo box
@@ -0,0 +1,27 @@
+from lib.components.menu_model import MenuModel
+from lib.utils import fuzzy_index
+from lib.utils.fuzzy_index import FuzzyIndex
+
+
+def test_failed_background_rebuild_falls_back_to_a_synchronous_one(qapp, monkeypatch, wait_until):
+    model = MenuModel()
+    for number in range(50):
+        model.add(f"Report {number}", view_key=f"report{number}")
+    index = FuzzyIndex()
+    index.attach(model)
+
+    real_build = fuzzy_index._build
+
+    def failing_build(task, items):
+        if task is not None:
+            raise RuntimeError("boom")
+        return real_build(task, items)
+
+    monkeypatch.setattr(fuzzy_index, "_build", failing_build)
+    index.rebuild(background=True)
+    results = []
+    index.search_async("report 7", results.append)
+    wait_until(lambda: results)
+
+    assert not index.rebuilding
+    assert results and results[0][0].view_key == "report7"
@@ -0,0 +1,38 @@
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QPushButton
+
+from lib.stores.icon_store import IconStore
+from lib.utils.icon_engine import MAX_VARIANTS
+
+
+def test_hidden_widget_keeps_icon_after_toggling_back(qapp):
+    store = IconStore()
+    button = QPushButton()
+    store.load_iconify_icon("home", False, widget=button)
+    light_key = store.icon_widgets.get(button).applied_key
+
+    store.update_icons(True)  # hidden: deferred until shown
+    assert store.icon_widgets.get(button).pending_dark_mode is True
+    assert store.update_icons(False)["skipped"] == 1
+
+    button.show()
+    entry = store.icon_widgets.get(button)
+    assert entry.pending_dark_mode is None
+    assert entry.dark_mode is False
+    assert entry.applied_key == light_key
+    button.close()
+
+
+def test_rendered_variants_count_against_cache_budget(qapp):
+    store = IconStore()
+    icon = store.load_iconify_icon("home", False)
+    for extent in range(8, 31):
+        for dpr in (1.0, 2.0):
+            for mode in (QIcon.Normal, QIcon.Disabled, QIcon.Active, QIcon.Selected):
+                icon.pixmap(QSize(extent, extent), dpr, mode)
+
+    assert len(icon.variants) == MAX_VARIANTS
+    assert store.icon_cache.total_cost == sum(p.width() * p.height() * 4 for p in icon.variants.values())
+    store.set_cache_budget(store.icon_cache.total_cost - 1)
+    assert store.icon_cache.stats()["evictions"] == 1
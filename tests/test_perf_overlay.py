@@ -0,0 +1,29 @@
+from PySide6.QtWidgets import QWidget
+
+from lib.components.perf_overlay import PerfOverlay
+from lib.utils.perf import profiler
+
+
+def make_overlay():
+    window = QWidget()
+    window.show()
+    return PerfOverlay(window)
+
+
+def test_hiding_the_overlay_disables_the_profiler_it_enabled(qapp):
+    overlay = make_overlay()
+    overlay.toggle()
+    assert profiler.enabled
+    overlay.toggle()
+    assert not profiler.enabled
+
+
+def test_hiding_the_overlay_keeps_a_command_line_profiler(qapp):
+    profiler.enable()
+    try:
+        overlay = make_overlay()
+        overlay.toggle()
+        overlay.toggle()
+        assert profiler.enabled
+    finally:
+        profiler.disable()
@@ -0,0 +1,22 @@
+import asyncio
+
+from lib.utils.qt_asyncio import QtAsyncioDriver
+
+
+def test_idle_loop_stops_the_step_timer(qapp, wait_until):
+    driver = QtAsyncioDriver()  # not started: no lag probe keeps it busy
+    try:
+        driver.step()
+        assert not driver._timer.isActive()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return 42
+
+        task = driver.run(work())
+        assert driver._timer.isActive()
+        assert wait_until(task.done)
+        assert task.result() == 42
+        assert not driver._timer.isActive()
+    finally:
+        driver.close()
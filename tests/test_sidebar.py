@@ -0,0 +1,59 @@
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QWidget
+
+from lib.components.main_window import MainWindow
+
+
+@pytest.fixture
+def window(qapp):
+    from lib.stores.theme_store import theme_store
+
+    theme_store.app = qapp
+    window = MainWindow()
+    window.show()
+    yield window
+    window.close()
+
+
+def test_buttons_follow_menu_model_changes(window):
+    sidebar = window.sidebar
+    menu_model = sidebar.menu_model
+    settings = next(node for node in menu_model.roots if node.children)
+
+    window.view_manager.register("example3b", QWidget)
+    node = menu_model.add("Example 3b", "example3b", "template", parent=settings)
+    window.set_view("example3b")
+    button = sidebar.view_key_buttons["example3b"]
+    assert button.property("selected")
+
+    menu_model.remove(node)
+    QCoreApplication.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert "example3b" not in sidebar.view_key_buttons
+    assert all(b.text() != "Example 3b" for b in sidebar.all_menu_buttons())
+
+
+def test_retint_keeps_theme_update_of_hidden_buttons_deferred(window):
+    from lib.stores.icon_store import icon_store
+    from lib.stores.theme_store import theme_store
+
+    window.sidebar.expanded = False
+    window.sidebar.update_menu_visibility()  # hides the submenu entries
+    stats = theme_store.toggle_theme()
+    assert stats["deferred"] >= 2
+
+    hidden = [button for button in window.sidebar.view_key_buttons.values() if not button.isVisible()]
+    assert hidden
+    for button in hidden:
+        entry = icon_store.icon_widgets.get(button)
+        assert entry.pending_dark_mode == theme_store.dark_mode
+        assert entry.dark_mode != theme_store.dark_mode
+
+    window.sidebar.expanded = True
+    window.sidebar.update_menu_visibility()
+    for button in hidden:
+        entry = icon_store.icon_widgets.get(button)
+        assert entry.pending_dark_mode is None
+        assert entry.dark_mode == theme_store.dark_mode
+    theme_store.toggle_theme()
@@ -0,0 +1,42 @@
+import shiboken6
+from PySide6.QtWidgets import QPushButton, QWidget
+
+from lib.utils import ui_batch
+
+
+def test_updates_stay_disabled_until_flush(qapp):
+    window = QWidget()
+    button = QPushButton(window)
+    with ui_batch.ui_batch(window):
+        assert not window.updatesEnabled()
+        with ui_batch.ui_batch(button):
+            assert not button.updatesEnabled()
+    assert window.updatesEnabled() and button.updatesEnabled()
+
+
+def test_requests_are_coalesced_per_widget(qapp):
+    window = QWidget()
+    button = QPushButton(window)
+    applied = []
+    ui_batch.reset_stats()
+    with ui_batch.ui_batch(window):
+        for _ in range(3):
+            ui_batch.repolish(button)
+            ui_batch.set_icon(button, lambda: applied.append("icon"))
+    assert applied == ["icon"]
+    stats = ui_batch.stats()
+    assert stats["styles_applied"] == 1 and stats["icons_applied"] == 1
+    assert stats["coalesced"] == 4
+
+
+def test_deleted_widgets_are_not_counted_as_applied(qapp):
+    window = QWidget()
+    button = QPushButton(window)
+    ui_batch.reset_stats()
+    with ui_batch.ui_batch(window):
+        ui_batch.repolish(button)
+        ui_batch.set_icon(button, lambda: None)
+        shiboken6.delete(button)
+    stats = ui_batch.stats()
+    assert stats["styles_applied"] == 0 and stats["icons_applied"] == 0
+    assert stats["coalesced"] == 2
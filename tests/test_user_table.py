@@ -0,0 +1,60 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QStyleOptionViewItem
+
+from lib.components.user_table import AGE_COLUMN, NAME_COLUMN, AgeComboDelegate, UserFilterProxyModel, UserTableModel
+from lib.utils.row_loader import RowLoader, iter_csv
+
+
+def test_malformed_csv_rows_are_skipped_and_loading_continues(qapp, tmp_path, wait_until):
+    path = tmp_path / "users.csv"
+    path.write_text("name,age\nAda,36\nBob,not a number\nCleo\nDan,41\n" + "".join(f"User {n},{n}\n" for n in range(20)))
+    model = UserTableModel()
+    loader = RowLoader(lambda: iter_csv(str(path)), model.insert_records, chunk_size=4).start()
+    finished = []
+    loader.finished.connect(finished.append)
+
+    assert wait_until(lambda: finished)
+    assert model.rowCount() == 22
+    assert model.rejected_records == [["Bob", "not a number"], ["Cleo"]]
+
+
+def test_age_editor_keeps_a_value_outside_the_choices(qapp):
+    model = UserTableModel([("New User", 0)])
+    index = model.index(0, AGE_COLUMN)
+    delegate = AgeComboDelegate()
+    editor = delegate.createEditor(None, QStyleOptionViewItem(), index)
+    delegate.setEditorData(editor, index)
+
+    assert editor.currentText() == "0"
+    delegate.setModelData(editor, model, index)
+    assert model.data(index) == 0
+
+
+def proxy_names(proxy):
+    return [proxy.index(row, NAME_COLUMN).data() for row in range(proxy.rowCount())]
+
+
+def test_proxy_follows_ascending_then_descending_sort(qapp):
+    model = UserTableModel([("Bob", 30), ("Ada", 40), ("Cleo", 18)])
+    proxy = UserFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    proxy.sort(NAME_COLUMN, Qt.AscendingOrder)
+    assert proxy_names(proxy) == ["Ada", "Bob", "Cleo"]
+    proxy.sort(NAME_COLUMN, Qt.DescendingOrder)
+    assert proxy_names(proxy) == ["Cleo", "Bob", "Ada"]
+    proxy.sort(AGE_COLUMN, Qt.DescendingOrder)
+    assert proxy_names(proxy) == ["Ada", "Bob", "Cleo"]
+
+
+def test_records_inserted_after_a_sort_are_sorted_in(qapp):
+    model = UserTableModel([("Bob", 30), ("Ada", 40)])
+    proxy = UserFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.sort(NAME_COLUMN, Qt.DescendingOrder)
+
+    model.insert_records([("Ben", 25), ("Zoe", 20)])
+    assert proxy_names(proxy) == ["Zoe", "Bob", "Ben", "Ada"]
+    proxy.sort(-1)
+    model.insert_records([("Amy", 50)])
+    assert proxy_names(proxy)[-1] == "Amy"